@@ -1,4 +1,5 @@
 import os
+import time
 import asyncio
 from pyrogram import Client
 from pyrogram.errors import (
@@ -7,15 +8,24 @@ from pyrogram.errors import (
 )
 
 from database import DatabaseManager
+from user_session import UserSession
+
+# Downloads Pyrogram runs in parallel per client (its default is 1)
+MAX_CONCURRENT_TRANSMISSIONS = 4
+# Logged-in clients stay connected between requests until idle this long
+SESSION_IDLE_TIMEOUT = 30 * 60
+SESSION_REAP_INTERVAL = 60
 
 class AuthManager:
     def __init__(self, api_id, api_hash, workdir="sessions"):
         self.api_id = api_id
         self.api_hash = api_hash
         self.workdir = workdir
-        self.db = DatabaseManager()
+        self.db = DatabaseManager.get_shared()
         os.makedirs(workdir, exist_ok=True)
         self.active_clients = {}  # Track active clients during auth
+        self.session_clients = {}  # {user_id: [client, users, last_used, connect_lock]} for logged-in users
+        self._reaper_task = None
     
     def get_user_session_file(self, user_id):
         """Get session file path for user"""
@@ -26,6 +36,9 @@ class AuthManager:
         session_file = self.get_user_session_file(user_id)
         
         try:
+            # The cached client of a previous login holds the same session file open
+            await self.forget_user_session(user_id)
+            
             # Clean up any existing client for this user
             if user_id in self.active_clients:
                 try:
@@ -122,6 +135,9 @@ class AuthManager:
             if user_id in self.active_clients:
                 del self.active_clients[user_id]
             
+            # A client cached from an earlier login must not be handed out for the new session
+            await self.forget_user_session(user_id)
+            
             return {'success': True, 'message': 'Authentication successful!'}
             
         except Exception as e:
@@ -180,6 +196,9 @@ class AuthManager:
             if user_id in self.active_clients:
                 del self.active_clients[user_id]
             
+            # A client cached from an earlier login must not be handed out for the new session
+            await self.forget_user_session(user_id)
+            
             return {'success': True, 'message': 'Authentication successful!'}
             
         except Exception as e:
@@ -236,38 +255,115 @@ class AuthManager:
             print(f"❌ Authentication check failed for user {user_id}: {e}")
             return False
     
-    def get_user_session(self, user_id):
-        """Get user's session client - FIXED VERSION"""
+    async def get_user_session(self, user_id):
+        """Get user's session client, connected - FIXED VERSION"""
         if not self.is_user_authenticated(user_id):
             print(f"❌ Cannot get session for unauthenticated user: {user_id}")
             return None
         
+        # Reuse the user's client, still connected from an earlier request if not idle too long
+        entry = self.session_clients.get(user_id)
+        if entry:
+            entry[1] += 1
+            entry[2] = time.monotonic()
+        else:
+            entry = self._create_session_entry(user_id)
+            if not entry:
+                return None
+        
+        # Callers share the client; only one of them may connect it
+        client, _, _, connect_lock = entry
+        async with connect_lock:
+            if not client.is_connected:
+                try:
+                    await client.connect()
+                    print(f"✅ Session client connected for user: {user_id}")
+                except Exception:
+                    self.release_user_session(user_id)
+                    raise
+        return client
+    
+    def _create_session_entry(self, user_id):
+        """Create and cache a client for the user, counted as in use once"""
         try:
             client = Client(
                 f"user_{user_id}",
                 api_id=self.api_id,
                 api_hash=self.api_hash,
-                workdir=self.workdir
+                workdir=self.workdir,
+                # The dispatcher never runs for cached clients, so nothing would drain their updates
+                no_updates=True,
+                max_concurrent_transmissions=MAX_CONCURRENT_TRANSMISSIONS
             )
             
+            entry = [client, 1, time.monotonic(), asyncio.Lock()]
+            self.session_clients[user_id] = entry
+            if self._reaper_task is None:
+                self._reaper_task = asyncio.create_task(self._reap_idle_sessions())
+            
             print(f"✅ Session client created for user: {user_id}")
-            return client
+            return entry
         except Exception as e:
             print(f"❌ Failed to create session client for user {user_id}: {e}")
             return None
 
+    def release_user_session(self, user_id):
+        """Mark the user's client unused; it stays connected until the idle timeout"""
+        entry = self.session_clients.get(user_id)
+        if entry:
+            entry[1] = max(entry[1] - 1, 0)
+            entry[2] = time.monotonic()
+    
+    async def forget_user_session(self, user_id):
+        """Drop and disconnect the user's cached client, e.g. on logout, re-login or a revoked session"""
+        # Peers resolved with the old session's access hashes are not in the next session file
+        UserSession.forget_user_peers(user_id)
+        entry = self.session_clients.pop(user_id, None)
+        if entry and entry[0].is_connected:
+            try:
+                await entry[0].disconnect()
+            except Exception as e:
+                print(f"⚠️ Error closing cached session for user {user_id}: {e}")
+    
+    async def _reap_idle_sessions(self):
+        """Disconnect clients nobody has used for SESSION_IDLE_TIMEOUT"""
+        while True:
+            await asyncio.sleep(SESSION_REAP_INTERVAL)
+            cutoff = time.monotonic() - SESSION_IDLE_TIMEOUT
+            idle = [
+                user_id for user_id, (_, users, last_used, _) in self.session_clients.items()
+                if users == 0 and last_used < cutoff
+            ]
+            for user_id in idle:
+                # Disconnects below await, so an entry may have been picked up again or forgotten since
+                entry = self.session_clients.get(user_id)
+                if not entry or entry[1] != 0 or entry[2] >= cutoff:
+                    continue
+                self.session_clients.pop(user_id, None)
+                client = entry[0]
+                try:
+                    if client.is_connected:
+                        await client.disconnect()
+                    print(f"💤 Closed idle session for user {user_id}")
+                except Exception as e:
+                    print(f"⚠️ Error closing idle session for user {user_id}: {e}")
+    
     async def test_session(self, user_id):
         """Test if session is valid by attempting to connect"""
-        client = self.get_user_session(user_id)
+        try:
+            client = await self.get_user_session(user_id)
+        except Exception as e:
+            print(f"❌ Session test failed for user {user_id}: {e}")
+            return False
         if not client:
             return False
         
         try:
-            await client.connect()
             me = await client.get_me()
-            await client.disconnect()
             print(f"✅ Session test successful for user {user_id}: {me.first_name}")
             return True
         except Exception as e:
             print(f"❌ Session test failed for user {user_id}: {e}")
-            return False
\ No newline at end of file
+            return False
+        finally:
+            self.release_user_session(user_id)
\ No newline at end of file
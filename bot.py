@@ -23,7 +23,7 @@ class TelegramDownloader:
         self.config.validate_config()
         
         # Initialize database and managers
-        self.db = DatabaseManager()
+        self.db = DatabaseManager.get_shared()
         self.auth_manager = AuthManager(Config.API_ID, Config.API_HASH, Config.SESSION_DIR)
         self.premium_manager = PremiumManager(self.db)
         
@@ -445,7 +445,8 @@ class TelegramDownloader:
         user_id = callback_query.from_user.id
         await client.send_chat_action(callback_query.message.chat.id, ChatAction.TYPING)
         
-        # Remove session file but KEEP subscription data in database
+        # Close the cached client, then remove session file but KEEP subscription data in database
+        await self.auth_manager.forget_user_session(user_id)
         session_file = self.auth_manager.get_user_session_file(user_id)
         if os.path.exists(session_file):
             os.remove(session_file)
@@ -502,7 +503,7 @@ class TelegramDownloader:
             status_msg = await message.reply_text("🔗 Processing link...")
             
             # Create user session - FASTER CONNECTION
-            user_session = UserSession(self.auth_manager, user_id, self.bot)
+            user_session = UserSession(self.auth_manager, user_id, self.bot, self.db)
             await user_session.connect()
             
             try:
@@ -696,7 +697,7 @@ class TelegramDownloader:
             return
         
         # Cleanup and success
-        FileManager.cleanup_file(downloaded_path)
+        await FileManager.cleanup_file_async(downloaded_path)
         
         # Update last download time for cooldown
         self.last_download_time[user_id] = time.time()
@@ -879,12 +880,10 @@ class TelegramDownloader:
     
     async def handle_compare_plans(self, client, callback_query):
         """Show plan comparison"""
-        premium_manager = PremiumManager(self.db)
-        
-        free_benefits = premium_manager.get_premium_benefits("free")
-        premium_benefits = premium_manager.get_premium_benefits("premium")
-        pro_benefits = premium_manager.get_premium_benefits("pro")
-        admin_benefits = premium_manager.get_premium_benefits("admin")
+        free_benefits = self.premium_manager.get_premium_benefits("free")
+        premium_benefits = self.premium_manager.get_premium_benefits("premium")
+        pro_benefits = self.premium_manager.get_premium_benefits("pro")
+        admin_benefits = self.premium_manager.get_premium_benefits("admin")
         
         comparison_text = """
 📊 **Plan Comparison**
@@ -1454,7 +1453,7 @@ class TelegramDownloader:
             status_msg = await message.reply_text("📦 Starting batch download...")
             
             # Create user session
-            user_session = UserSession(self.auth_manager, user_id, self.bot)
+            user_session = UserSession(self.auth_manager, user_id, self.bot, self.db)
             await user_session.connect()
             
             try:
@@ -1473,7 +1472,7 @@ class TelegramDownloader:
                         if downloaded_path:
                             # Upload through bot
                             await self._upload_file_through_bot(user_id, downloaded_path, f"Batch download #{i+1}")
-                            FileManager.cleanup_file(downloaded_path)
+                            await FileManager.cleanup_file_async(downloaded_path)
                             downloaded_count += 1
                             
                             # Update download count
@@ -1789,7 +1788,7 @@ class TelegramDownloader:
             status_msg = await message.reply_text("⚡ Forwarding content...")
             
             # Create user session
-            user_session = UserSession(self.auth_manager, user_id, self.bot)
+            user_session = UserSession(self.auth_manager, user_id, self.bot, self.db)
             await user_session.connect()
             
             try:
@@ -2067,7 +2066,7 @@ class TelegramDownloader:
             
             system_stats = self.db.get_system_stats()
             print(f"📊 System stats: {system_stats['total_users']} users, {system_stats['total_downloads']} downloads")
-            print(f"👑 Admin users: {Config.ADMIN_IDS}")
+            print(f"👑 Admin users: {sorted(Config.ADMIN_IDS)}")
             print("✅ Premium Downloader Bot ready!")
             
             # Keep running
@@ -2095,4 +2094,13 @@ if __name__ == "__main__":
     os.makedirs("sessions", exist_ok=True)
     os.makedirs("downloads", exist_ok=True)
     
+    # uvloop is optional and not available on Windows
+    if sys.platform != "win32":
+        try:
+            import uvloop
+            uvloop.install()
+            print("⚡ Using uvloop event loop")
+        except ImportError:
+            pass
+    
     asyncio.run(main())
@@ -13,40 +13,40 @@ class ChannelVerification:
         if not self.auth_manager.is_user_authenticated(user_id):
             return False, "User not authenticated"
         
-        user_session = self.auth_manager.get_user_session(user_id)
+        try:
+            # The auth manager shares this client across requests and connects it if needed
+            user_session = await self.auth_manager.get_user_session(user_id)
+        except Exception as e:
+            return False, f"Connection error: {str(e)}"
         if not user_session:
             return False, "Session not found"
         
         try:
-            await user_session.connect()
-            
             # Try multiple methods to check membership
             try:
                 # Method 1: Try to get chat member info
                 member = await user_session.get_chat_member(channel_username, "me")
                 is_member = member.status in ['creator', 'administrator', 'member']
-                await user_session.disconnect()
                 return is_member, "Checked via member status"
                 
             except UserNotParticipant:
-                await user_session.disconnect()
                 return False, "Not a member (UserNotParticipant)"
             except ChannelPrivate:
-                await user_session.disconnect()
                 return False, "Channel is private"
             except Exception as e:
                 # Method 2: Try to access the chat directly
                 try:
                     chat = await user_session.get_chat(channel_username)
                     # If we can access the chat without error, assume we're a member
-                    await user_session.disconnect()
                     return True, "Access granted to chat"
                 except Exception as e2:
-                    await user_session.disconnect()
                     return False, f"Cannot access: {str(e2)}"
                 
         except Exception as e:
             return False, f"Connection error: {str(e)}"
+        finally:
+            # Hand the client back instead of disconnecting it under other requests
+            self.auth_manager.release_user_session(user_id)
     
     async def verify_all_channels(self, user_id, channels):
         """Verify user is member of all required channels - FIXED VERSION"""
@@ -0,0 +1,37 @@
+import os
+
+COMPILED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config_compiled.py")
+
+# Paths are derived from the working directory at runtime, so they are not frozen
+RUNTIME_KEYS = {"DB_PATH", "SESSION_DIR", "DOWNLOAD_DIR"}
+
+def compile_config():
+    """Read .env once and write Config's values to config_compiled.py next to config.py,
+    the only place config.py looks for it"""
+    path = COMPILED_PATH
+    # Remove the previous build so Config is loaded from .env, not from itself
+    if os.path.exists(path):
+        os.remove(path)
+
+    from config import Config
+
+    names = [
+        name for name in vars(Config)
+        if name.isupper() and name not in RUNTIME_KEYS
+    ]
+
+    lines = [
+        "# Generated by compile_config.py - do not edit, do not commit",
+        f"__all__ = {names!r}",
+        "",
+    ]
+    lines.extend(f"{name} = {getattr(Config, name)!r}" for name in names)
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    print(f"✅ Compiled {len(names)} settings to {path}")
+    return path
+
+if __name__ == "__main__":
+    compile_config()
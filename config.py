@@ -1,7 +1,13 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Deployments can freeze the settings with `python compile_config.py`;
+# fall back to parsing .env when no compiled module is present
+try:
+    import config_compiled
+except ImportError:
+    config_compiled = None
+    load_dotenv()
 
 class Config:
     # Bot credentials
@@ -12,10 +18,11 @@ class Config:
     API_HASH = os.getenv("API_HASH")
     
     # Admin user IDs - FIXED: Handle empty string case
-    ADMIN_IDS = []
+    # Stored as a frozenset so every `in Config.ADMIN_IDS` check is O(1)
+    ADMIN_IDS = frozenset()
     admin_ids_str = os.getenv("ADMIN_IDS", "")
     if admin_ids_str:
-        ADMIN_IDS = [int(x.strip()) for x in admin_ids_str.split(",") if x.strip()]
+        ADMIN_IDS = frozenset(int(x.strip()) for x in admin_ids_str.split(",") if x.strip())
     
     # Support channel
     SUPPORT_CHANNEL = os.getenv("SUPPORT_CHANNEL", "https://t.me/hectorbotsfiles")
@@ -32,6 +39,12 @@ class Config:
     PREMIUM_FILE_SIZE = int(os.getenv("PREMIUM_FILE_SIZE", "2048")) * 1024 * 1024
     PRO_FILE_SIZE = int(os.getenv("PRO_FILE_SIZE", "5120")) * 1024 * 1024
     
+    # Memory held by one chunked download's fetched-but-unwritten chunks
+    DOWNLOAD_MAX_INFLIGHT_BYTES = int(os.getenv("DOWNLOAD_MAX_INFLIGHT_MB", "16")) * 1024 * 1024
+    
+    # PostgreSQL database URL
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    
     # Database path
     DB_PATH = os.path.join(os.getcwd(), os.getenv("DB_PATH", "users.db"))
     
@@ -67,6 +80,10 @@ class Config:
         print(f"📁 Sessions: {cls.SESSION_DIR}")
         print(f"📁 Downloads: {cls.DOWNLOAD_DIR}")
         print(f"📁 Database: {cls.DB_PATH}")
-        print(f"👑 Admin IDs: {cls.ADMIN_IDS}")
+        print(f"👑 Admin IDs: {sorted(cls.ADMIN_IDS)}")
         print(f"💰 Payment Methods: {[k for k, v in cls.PAYMENT_METHODS.items() if v]}")
-        print(f"📢 Support Channel: {cls.SUPPORT_CHANNEL}")
\ No newline at end of file
+        print(f"📢 Support Channel: {cls.SUPPORT_CHANNEL}")
+
+if config_compiled is not None:
+    for _name in config_compiled.__all__:
+        setattr(Config, _name, getattr(config_compiled, _name))
@@ -1,16 +1,26 @@
 import psycopg2
 import psycopg2.extras
-import os
 import time
 from datetime import datetime, timedelta
 import threading
-from dotenv import load_dotenv
 
-load_dotenv()
+from config import Config
 
 class DatabaseManager:
+    _shared = None
+    _shared_lock = threading.Lock()
+    
+    @classmethod
+    def get_shared(cls):
+        """Return the process-wide instance, creating it (and the tables) on first use"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+    
     def __init__(self):
-        self.db_url = os.getenv("DATABASE_URL")
+        self.db_url = Config.DATABASE_URL
         if not self.db_url:
             raise ValueError("DATABASE_URL environment variable not set")
         
@@ -33,8 +43,11 @@ class DatabaseManager:
                 conn = self.get_connection()
                 cursor = conn.cursor()
                 
-                # Users table with premium fields
-                cursor.execute('''
+                # Tables are ordered so every foreign key target exists first;
+                # everything is sent in a single round trip
+                ddl = "\n".join([
+                    # Users table with premium fields
+                    '''
                     CREATE TABLE IF NOT EXISTS users (
                         user_id BIGINT PRIMARY KEY,
                         phone_number TEXT,
@@ -49,22 +62,20 @@ class DatabaseManager:
                         last_used TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         subscription_expiry TIMESTAMP
-                    )
-                ''')
-                
-                # Download stats table
-                cursor.execute('''
+                    );
+                    ''',
+                    # Download stats table
+                    '''
                     CREATE TABLE IF NOT EXISTS download_stats (
                         id SERIAL PRIMARY KEY,
                         user_id BIGINT REFERENCES users(user_id),
                         file_name TEXT,
                         file_size BIGINT,
                         downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                ''')
-                
-                # Premium payments table
-                cursor.execute('''
+                    );
+                    ''',
+                    # Premium payments table
+                    '''
                     CREATE TABLE IF NOT EXISTS premium_payments (
                         id SERIAL PRIMARY KEY,
                         user_id BIGINT REFERENCES users(user_id),
@@ -74,8 +85,17 @@ class DatabaseManager:
                         status TEXT DEFAULT 'pending',
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                         verified_at TIMESTAMP
-                    )
-                ''')
+                    );
+                    ''',
+                    # Indexes for the per-user, status and recency lookups
+                    '''
+                    CREATE INDEX IF NOT EXISTS idx_users_last_used ON users (last_used);
+                    CREATE INDEX IF NOT EXISTS idx_download_stats_user ON download_stats (user_id, downloaded_at);
+                    CREATE INDEX IF NOT EXISTS idx_premium_payments_status ON premium_payments (status);
+                    CREATE INDEX IF NOT EXISTS idx_premium_payments_created ON premium_payments (created_at);
+                    '''
+                ])
+                cursor.execute(ddl)
                 
                 conn.commit()
                 conn.close()
@@ -129,7 +149,7 @@ class DatabaseManager:
         try:
             with self.lock:
                 conn = self.get_connection()
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
                 cursor.execute('''
                     SELECT * FROM users WHERE user_id = %s
@@ -171,9 +191,7 @@ class DatabaseManager:
                 conn.commit()
                 conn.close()
                 
-                if user:
-                    return dict(user)
-                return None
+                return user
                 
         except Exception as e:
             print(f"❌ Failed to get user {user_id}: {e}")
@@ -219,6 +237,35 @@ class DatabaseManager:
             print(f"❌ Failed to increment download count for user {user_id}: {e}")
             return False
     
+    def record_download(self, user_id, file_name, file_size):
+        """Increment download count and add the download stat in one transaction"""
+        return self.record_downloads(user_id, 1, [(file_name, file_size)])
+    
+    def record_downloads(self, user_id, count, stats=()):
+        """Add count downloads and insert (file_name, file_size) stats in one transaction"""
+        try:
+            with self.lock:
+                conn = self.get_connection()
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    UPDATE users SET download_count = download_count + %s, last_used = %s
+                    WHERE user_id = %s
+                ''', (count, datetime.now(), user_id))
+                if stats:
+                    cursor.executemany('''
+                        INSERT INTO download_stats (user_id, file_name, file_size)
+                        VALUES (%s, %s, %s)
+                    ''', [(user_id, file_name, file_size) for file_name, file_size in stats])
+                
+                conn.commit()
+                conn.close()
+                return True
+                
+        except Exception as e:
+            print(f"❌ Failed to record downloads for user {user_id}: {e}")
+            return False
+    
     def set_premium_status(self, user_id, premium_type):
         """Set user premium status (premium or pro)"""
         try:
@@ -294,13 +341,13 @@ class DatabaseManager:
         try:
             with self.lock:
                 conn = self.get_connection()
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
                 cursor.execute('''
                     SELECT * FROM premium_payments WHERE status = 'pending'
                 ''')
                 
-                payments = [dict(p) for p in cursor.fetchall()]
+                payments = cursor.fetchall()
                 conn.close()
                 return payments
                 
@@ -366,13 +413,13 @@ class DatabaseManager:
         try:
             with self.lock:
                 conn = self.get_connection()
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
                 cursor.execute('''
                     SELECT * FROM users ORDER BY created_at DESC
                 ''')
                 
-                users = [dict(u) for u in cursor.fetchall()]
+                users = cursor.fetchall()
                 conn.close()
                 return users
                 
@@ -520,7 +567,7 @@ class DatabaseManager:
         try:
             with self.lock:
                 conn = self.get_connection()
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
                 cursor.execute('''
                     SELECT file_name, file_size, downloaded_at 
@@ -530,7 +577,7 @@ class DatabaseManager:
                     LIMIT %s
                 ''', (user_id, limit))
                 
-                history = [dict(h) for h in cursor.fetchall()]
+                history = cursor.fetchall()
                 conn.close()
                 return history
                 
@@ -543,7 +590,7 @@ class DatabaseManager:
         try:
             with self.lock:
                 conn = self.get_connection()
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
                 cursor.execute('''
                     SELECT * FROM premium_payments 
@@ -551,7 +598,7 @@ class DatabaseManager:
                     LIMIT %s
                 ''', (limit,))
                 
-                payments = [dict(p) for p in cursor.fetchall()]
+                payments = cursor.fetchall()
                 conn.close()
                 return payments
                 
@@ -584,7 +631,7 @@ class DatabaseManager:
         try:
             with self.lock:
                 conn = self.get_connection()
-                cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+                cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
                 
                 cursor.execute('''
                     SELECT u.user_id, u.phone_number, COUNT(ds.id) as download_count, SUM(ds.file_size) as total_size
@@ -595,7 +642,7 @@ class DatabaseManager:
                     LIMIT %s
                 ''', (limit,))
                 
-                downloaders = [dict(d) for d in cursor.fetchall()]
+                downloaders = cursor.fetchall()
                 conn.close()
                 return downloaders
                 
@@ -2,49 +2,84 @@ import asyncio
 from datetime import datetime, timedelta
 from config import Config
 
+# Static benefits per tier, shared by every get_premium_benefits call
+_BENEFITS = {
+    "admin": {
+        "downloads": "Unlimited",
+        "file_size": "Unlimited",
+        "features": ("All features", "No restrictions", "Admin privileges"),
+        "cooldown": "None"
+    },
+    "free": {
+        "downloads": "5/day",
+        "file_size": "500MB",
+        "features": ("Basic downloads", "Standard support"),
+        "cooldown": "20 seconds"
+    },
+    "premium": {
+        "downloads": "50/day",
+        "file_size": "2GB",
+        "features": ("Priority downloads", "Batch downloads", "No cooldown", "Priority support"),
+        "cooldown": "None"
+    },
+    "pro": {
+        "downloads": "200/day",
+        "file_size": "5GB",
+        "features": ("Unlimited downloads", "Batch processing", "VIP support", "Custom requests"),
+        "cooldown": "None"
+    }
+}
+
 class PremiumManager:
+    __slots__ = ("db", "_admin_ids")
+    
+    # Per-tier limits, built once at import time
+    _DOWNLOAD_LIMITS = {
+        "free": Config.MAX_DOWNLOADS_PER_USER,
+        "premium": Config.MAX_DOWNLOADS_PREMIUM,
+        "pro": Config.MAX_DOWNLOADS_PRO
+    }
+    _SIZE_LIMITS = {
+        "free": Config.MAX_FILE_SIZE,
+        "premium": Config.PREMIUM_FILE_SIZE,
+        "pro": Config.PRO_FILE_SIZE
+    }
+    
     def __init__(self, db):
         self.db = db
+        self._admin_ids = Config.ADMIN_IDS
+    
+    def _is_admin(self, user_data):
+        """Check admin flag from database OR config"""
+        return user_data.get('is_admin', False) or user_data['user_id'] in self._admin_ids
+    
+    @staticmethod
+    def _plan_tier(user_data):
+        """Get paid plan tier, ignoring admin status"""
+        return "pro" if user_data.get('is_pro') else "premium" if user_data.get('is_premium') else "free"
     
     def get_user_tier(self, user_data):
         """Get user tier level"""
         # Admins have highest priority
-        if user_data.get('is_admin', False) or user_data['user_id'] in Config.ADMIN_IDS:
+        if self._is_admin(user_data):
             return "admin"
-        elif user_data.get('is_pro', False):
-            return "pro"
-        elif user_data.get('is_premium', False):
-            return "premium"
-        else:
-            return "free"
+        return self._plan_tier(user_data)
     
     def get_download_limit(self, user_data):
         """Get user's daily download limit - ADMINS HAVE UNLIMITED"""
         # Admins have unlimited downloads
-        if user_data.get('is_admin', False) or user_data['user_id'] in Config.ADMIN_IDS:
+        if self._is_admin(user_data):
             return 999999  # Effectively unlimited
         
-        tier = self.get_user_tier(user_data)
-        limits = {
-            "free": Config.MAX_DOWNLOADS_PER_USER,
-            "premium": Config.MAX_DOWNLOADS_PREMIUM,
-            "pro": Config.MAX_DOWNLOADS_PRO
-        }
-        return limits.get(tier, Config.MAX_DOWNLOADS_PER_USER)
+        return self._DOWNLOAD_LIMITS[self._plan_tier(user_data)]
     
     def get_file_size_limit(self, user_data):
         """Get user's file size limit in bytes - ADMINS HAVE UNLIMITED"""
         # Admins have unlimited file size
-        if user_data.get('is_admin', False) or user_data['user_id'] in Config.ADMIN_IDS:
+        if self._is_admin(user_data):
             return 50 * 1024 * 1024 * 1024  # 50GB for admins
         
-        tier = self.get_user_tier(user_data)
-        limits = {
-            "free": Config.MAX_FILE_SIZE,
-            "premium": Config.PREMIUM_FILE_SIZE,
-            "pro": Config.PRO_FILE_SIZE
-        }
-        return limits.get(tier, Config.MAX_FILE_SIZE)
+        return self._SIZE_LIMITS[self._plan_tier(user_data)]
     
     def can_download(self, user_data):
         """Check if user can download - ADMINS HAVE NO LIMITS"""
@@ -52,11 +87,11 @@ class PremiumManager:
             return False, "User not found"
         
         # Admins have unlimited downloads - NO LIMITS AT ALL
-        if user_data.get('is_admin', False) or user_data['user_id'] in Config.ADMIN_IDS:
+        if self._is_admin(user_data):
             return True, "Admin unlimited access"
         
-        # Check daily limit for non-admins
-        max_downloads = self.get_download_limit(user_data)
+        # Check daily limit for non-admins (admin check already done above)
+        max_downloads = self._DOWNLOAD_LIMITS[self._plan_tier(user_data)]
         used_downloads = user_data.get('download_count', 0)
         
         if used_downloads >= max_downloads:
@@ -66,17 +101,19 @@ class PremiumManager:
     
     def get_cooldown_time(self, user_data):
         """Get cooldown time between downloads - ADMINS HAVE NO COOLDOWN"""
-        if user_data.get('is_admin', False) or user_data['user_id'] in Config.ADMIN_IDS:
-            return 0  # No cooldown for admins
-        if self.get_user_tier(user_data) != "free":
-            return 0  # No cooldown for premium users
+        # No cooldown for admins or premium/pro users
+        if self._is_admin(user_data) or user_data.get('is_pro') or user_data.get('is_premium'):
+            return 0
         return Config.DOWNLOAD_COOLDOWN
     
     async def process_payment(self, user_id, payment_method, plan_type, transaction_id):
         """Process payment and add to pending"""
         amount = 5 if plan_type == "premium" else 15
         
-        success = self.db.add_payment(user_id, payment_method, amount, transaction_id)
+        # add_payment is a blocking database call, keep it off the event loop
+        success = await asyncio.get_running_loop().run_in_executor(
+            None, self.db.add_payment, user_id, payment_method, amount, transaction_id
+        )
         if success:
             return True, "Payment recorded! Waiting for verification."
         else:
@@ -84,30 +121,4 @@ class PremiumManager:
     
     def get_premium_benefits(self, tier):
         """Get benefits for each tier"""
-        benefits = {
-            "admin": {
-                "downloads": "Unlimited",
-                "file_size": "Unlimited",
-                "features": ["All features", "No restrictions", "Admin privileges"],
-                "cooldown": "None"
-            },
-            "free": {
-                "downloads": "5/day",
-                "file_size": "500MB",
-                "features": ["Basic downloads", "Standard support"],
-                "cooldown": "20 seconds"
-            },
-            "premium": {
-                "downloads": "50/day", 
-                "file_size": "2GB",
-                "features": ["Priority downloads", "Batch downloads", "No cooldown", "Priority support"],
-                "cooldown": "None"
-            },
-            "pro": {
-                "downloads": "200/day",
-                "file_size": "5GB", 
-                "features": ["Unlimited downloads", "Batch processing", "VIP support", "Custom requests"],
-                "cooldown": "None"
-            }
-        }
-        return benefits.get(tier, benefits["free"])
\ No newline at end of file
+        return _BENEFITS.get(tier, _BENEFITS["free"])
\ No newline at end of file
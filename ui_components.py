@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pyrogram.types import (
     InlineKeyboardMarkup, 
     InlineKeyboardButton,
@@ -7,71 +9,154 @@ from pyrogram.types import (
 
 from config import Config  # ADDED IMPORT
 
+# Static keyboards are built once at import time and shared between calls
+
+# Login keyboard with phone sharing
+_LOGIN_KB = ReplyKeyboardMarkup([
+    [KeyboardButton("📱 Share My Number", request_contact=True)],
+    [KeyboardButton("❌ Cancel")]
+], resize_keyboard=True, one_time_keyboard=True)
+
+# Premium plans selection
+_PREMIUM_PLANS_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("💎 Premium - $5/month", callback_data="premium_plan")],
+    [InlineKeyboardButton("🚀 Pro - $15/month", callback_data="pro_plan")],
+    [InlineKeyboardButton("📊 Compare Plans", callback_data="compare_plans")],
+    [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Back to Main", callback_data="main_menu")]
+])
+
+# Back to plans from all payments view
+_ALL_PAYMENTS_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("💎 Choose Plan", callback_data="premium_info")],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
+])
+
+# Admin menu
+_ADMIN_MENU_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📊 System Stats", callback_data="admin_stats")],
+    [InlineKeyboardButton("💎 Premium Management", callback_data="admin_premium")],
+    [InlineKeyboardButton("📢 Broadcast Message", callback_data="admin_broadcast")],
+    [InlineKeyboardButton("📢 Support Channel", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
+])
+
+# Premium management for admins
+_PREMIUM_MANAGEMENT_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📋 Pending Payments", callback_data="admin_pending_payments")],
+    [InlineKeyboardButton("➕ Add Premium User", callback_data="admin_add_premium")],
+    [InlineKeyboardButton("➕ Add Pro User", callback_data="admin_add_pro")],
+    [InlineKeyboardButton("➖ Remove Premium/Pro", callback_data="admin_remove_premium")],
+    [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Admin Menu", callback_data="admin_menu")]
+])
+
+# Cancel button
+_CANCEL_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("❌ Cancel", callback_data="main_menu")]
+])
+
+# Batch download options
+_BATCH_DOWNLOAD_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📥 Download 10 Recent", callback_data="batch_10")],
+    [InlineKeyboardButton("📥 Download 20 Recent", callback_data="batch_20")],
+    [InlineKeyboardButton("📥 Download 30 Recent", callback_data="batch_30")],
+    [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
+])
+
+# Contact admin buttons
+_CONTACT_ADMIN_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📞 Contact Admin", url="https://t.me/admin")],
+    [InlineKeyboardButton("🆘 Support Group", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
+])
+
+# Simple download button for after completion
+_SIMPLE_DOWNLOAD_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📥 Download", callback_data="download_media"),
+     InlineKeyboardButton("⚡ Forward", callback_data="forward_media")],
+    [InlineKeyboardButton("📊 My Stats", callback_data="stats"),
+     InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
+])
+
+# Stats menu buttons
+_STATS_KB = InlineKeyboardMarkup([
+    [InlineKeyboardButton("📥 Download Media", callback_data="download_media")],
+    [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
+    [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
+])
+
+@lru_cache(maxsize=16)
+def _build_main_menu(key):
+    """Build the main menu for a user-state key: -1 for logged out, else admin/premium/pro bits"""
+    if key < 0:
+        return InlineKeyboardMarkup([
+            [InlineKeyboardButton("🔐 Login", callback_data="login")],
+            [InlineKeyboardButton("ℹ️ Help", callback_data="help"),
+             InlineKeyboardButton("💎 Premium", callback_data="premium_info")],
+            [InlineKeyboardButton("📊 Stats", callback_data="stats"),
+             InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)]
+        ])
+    
+    is_admin = bool(key & 4)
+    is_premium = bool(key & 2)
+    is_pro = bool(key & 1)
+    
+    buttons = []
+    
+    if is_admin:
+        buttons.append([InlineKeyboardButton("👑 Admin Panel", callback_data="admin_menu")])
+    
+    # Add download and forward buttons
+    buttons.append([
+        InlineKeyboardButton("📥 Download", callback_data="download_media"),
+        InlineKeyboardButton("⚡ Forward", callback_data="forward_media")
+    ])
+    
+    # Add batch download for premium users or admins
+    if is_premium or is_pro or is_admin:
+        buttons.append([InlineKeyboardButton("📦 Batch Download", callback_data="batch_download")])
+    
+    # Add premium button if not premium
+    if not is_premium and not is_admin:
+        buttons.append([InlineKeyboardButton("💎 Upgrade to Premium", callback_data="premium_info")])
+    
+    # Add other buttons
+    buttons.extend([
+        [InlineKeyboardButton("📊 My Stats", callback_data="stats"),
+         InlineKeyboardButton("ℹ️ Help", callback_data="help")],
+        [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
+        [InlineKeyboardButton("🔐 Logout", callback_data="logout")]
+    ])
+    
+    return InlineKeyboardMarkup(buttons)
+
 class UIComponents:
     @staticmethod
     def get_main_menu(user_data=None):
         """Main menu with user status"""
         if not user_data:
-            return InlineKeyboardMarkup([
-                [InlineKeyboardButton("🔐 Login", callback_data="login")],
-                [InlineKeyboardButton("ℹ️ Help", callback_data="help"),
-                 InlineKeyboardButton("💎 Premium", callback_data="premium_info")],
-                [InlineKeyboardButton("📊 Stats", callback_data="stats"),
-                 InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)]
-            ])
-        
-        buttons = []
-        
-        # Check if user is admin
-        is_admin = user_data.get('is_admin', False)
-        
-        if is_admin:
-            buttons.append([InlineKeyboardButton("👑 Admin Panel", callback_data="admin_menu")])
-        
-        # Add download and forward buttons
-        buttons.append([
-            InlineKeyboardButton("📥 Download", callback_data="download_media"),
-            InlineKeyboardButton("⚡ Forward", callback_data="forward_media")
-        ])
+            return _build_main_menu(-1)
         
-        # Add batch download for premium users or admins
-        if user_data.get('is_premium', False) or user_data.get('is_pro', False) or is_admin:
-            buttons.append([InlineKeyboardButton("📦 Batch Download", callback_data="batch_download")])
-        
-        # Add premium button if not premium
-        if not user_data.get('is_premium', False) and not is_admin:
-            buttons.append([InlineKeyboardButton("💎 Upgrade to Premium", callback_data="premium_info")])
-        
-        # Add other buttons
-        buttons.extend([
-            [InlineKeyboardButton("📊 My Stats", callback_data="stats"),
-             InlineKeyboardButton("ℹ️ Help", callback_data="help")],
-            [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔐 Logout", callback_data="logout")]
-        ])
-        
-        return InlineKeyboardMarkup(buttons)
+        is_admin = bool(user_data.get('is_admin', False))
+        is_premium = bool(user_data.get('is_premium', False))
+        is_pro = bool(user_data.get('is_pro', False))
+        return _build_main_menu((is_admin << 2) | (is_premium << 1) | is_pro)
     
     @staticmethod
     def get_login_keyboard():
         """Login keyboard with phone sharing"""
-        return ReplyKeyboardMarkup([
-            [KeyboardButton("📱 Share My Number", request_contact=True)],
-            [KeyboardButton("❌ Cancel")]
-        ], resize_keyboard=True, one_time_keyboard=True)
+        return _LOGIN_KB
     
     @staticmethod
     def get_premium_plans_keyboard():
         """Premium plans selection - REMOVED ALL PAYMENTS BUTTON"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("💎 Premium - $5/month", callback_data="premium_plan")],
-            [InlineKeyboardButton("🚀 Pro - $15/month", callback_data="pro_plan")],
-            [InlineKeyboardButton("📊 Compare Plans", callback_data="compare_plans")],
-            [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Back to Main", callback_data="main_menu")]
-        ])
+        return _PREMIUM_PLANS_KB
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_payment_methods_keyboard(plan_type):
         """Payment methods for premium - REMOVED ALL PAYMENTS BUTTON"""
         return InlineKeyboardMarkup([
@@ -87,35 +172,20 @@ class UIComponents:
     @staticmethod
     def get_all_payments_keyboard():
         """Back to plans from all payments view - REMOVED THIS FUNCTIONALITY"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("💎 Choose Plan", callback_data="premium_info")],
-            [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
-        ])
+        return _ALL_PAYMENTS_KB
     
     @staticmethod
     def get_admin_menu():
         """Admin menu"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("📊 System Stats", callback_data="admin_stats")],
-            [InlineKeyboardButton("💎 Premium Management", callback_data="admin_premium")],
-            [InlineKeyboardButton("📢 Broadcast Message", callback_data="admin_broadcast")],
-            [InlineKeyboardButton("📢 Support Channel", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
-        ])
+        return _ADMIN_MENU_KB
     
     @staticmethod
     def get_premium_management_keyboard():
         """Premium management for admins"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("📋 Pending Payments", callback_data="admin_pending_payments")],
-            [InlineKeyboardButton("➕ Add Premium User", callback_data="admin_add_premium")],
-            [InlineKeyboardButton("➕ Add Pro User", callback_data="admin_add_pro")],
-            [InlineKeyboardButton("➖ Remove Premium/Pro", callback_data="admin_remove_premium")],
-            [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Admin Menu", callback_data="admin_menu")]
-        ])
+        return _PREMIUM_MANAGEMENT_KB
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def get_payment_verification_keyboard(payment_id):
         """Payment verification buttons for admins"""
         return InlineKeyboardMarkup([
@@ -131,61 +201,38 @@ class UIComponents:
     @staticmethod
     def get_cancel_keyboard():
         """Cancel button"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("❌ Cancel", callback_data="main_menu")]
-        ])
+        return _CANCEL_KB
     
     @staticmethod
     def get_back_keyboard(target="main_menu"):
         """Back button"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("🔙 Back", callback_data=target)]
-        ])
+        return InlineKeyboardMarkup((
+            (InlineKeyboardButton("🔙 Back", callback_data=target),),
+        ))
     
     @staticmethod
     def get_batch_download_keyboard():
         """Batch download options"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("📥 Download 10 Recent", callback_data="batch_10")],
-            [InlineKeyboardButton("📥 Download 20 Recent", callback_data="batch_20")],
-            [InlineKeyboardButton("📥 Download 30 Recent", callback_data="batch_30")],
-            [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
-        ])
+        return _BATCH_DOWNLOAD_KB
     
     @staticmethod
     def get_contact_admin_keyboard():
         """Contact admin buttons"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("📞 Contact Admin", url="https://t.me/admin")],
-            [InlineKeyboardButton("🆘 Support Group", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Back", callback_data="main_menu")]
-        ])
+        return _CONTACT_ADMIN_KB
     
     @staticmethod
     def get_simple_download_keyboard():
         """Simple download button for after completion"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("📥 Download", callback_data="download_media"),
-             InlineKeyboardButton("⚡ Forward", callback_data="forward_media")],
-            [InlineKeyboardButton("📊 My Stats", callback_data="stats"),
-             InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
-        ])
+        return _SIMPLE_DOWNLOAD_KB
     
     @staticmethod
     def get_stats_keyboard():
         """Stats menu buttons"""
-        return InlineKeyboardMarkup([
-            [InlineKeyboardButton("📥 Download Media", callback_data="download_media")],
-            [InlineKeyboardButton("📢 Support", url=Config.SUPPORT_CHANNEL)],
-            [InlineKeyboardButton("🔙 Main Menu", callback_data="main_menu")]
-        ])
+        return _STATS_KB
 
-class Messages:
-    @staticmethod
-    def get_welcome_message():
-        return """
+# Constant message texts, shared by the Messages getters
+
+_WELCOME_MSG = """
 🤖 **Welcome to Premium Downloader Bot!**
 
 ✨ **Features:**
@@ -200,10 +247,8 @@ class Messages:
 
 Click **🔐 Login** to get started!
         """
-    
-    @staticmethod
-    def get_premium_info_message():
-        return """
+
+_PREMIUM_INFO_MSG = """
 💎 **Premium Plans**
 
 **Free Tier:**
@@ -228,11 +273,8 @@ Click **🔐 Login** to get started!
 
 Choose a plan to continue:
         """
-    
-    @staticmethod
-    def get_all_payment_methods_message():
-        """All payment methods in one message - UPDATED TO REDIRECT"""
-        return """
+
+_ALL_PAYMENT_METHODS_MSG = """
 💰 **Payment Methods**
 
 Please choose your preferred payment method from the previous menu.
@@ -248,15 +290,88 @@ If you need assistance with payments, please contact @official_kango directly.
 
 Contact @official_kango for any payment issues.
         """
-    
-    @staticmethod
-    def get_payment_instructions(method, plan_type, payment_info):
-        plan_name = "Premium" if plan_type == "premium" else "Pro"
-        amount = "$5" if plan_type == "premium" else "$15"
-        downloads = "50" if plan_type == "premium" else "200"
-        size = "2GB" if plan_type == "premium" else "5GB"
-        
-        instructions = f"""
+
+_HELP_MSG = """
+ℹ️ **Help Center**
+
+**How to Use:**
+1. Click **🔐 Login** and share your phone number
+2. Click **📥 Download** or **⚡ Forward**
+3. Send any Telegram link
+
+**Download vs Forward:**
+• **📥 Download** - Downloads file to server, then sends to you
+• **⚡ Forward** - Copies content directly (faster, no size limits)
+
+**Supported Links:**
+• `t.me/username/123` - Public channels
+• `t.me/c/123456789/2` - Private channels  
+• `@username/123` - Short format
+
+**Commands:**
+• `/start` - Start the bot
+• `/forward` - Fast forward content
+• `/batch` - Batch download (Premium/Pro only)
+• `/addprem` - Add premium user (Admin only)
+• `/addpro` - Add pro user (Admin only)
+• `/deleteprem` - Remove premium/pro (Admin only)
+• `/broadcast` - Broadcast message (Admin only)
+
+**Need Help?**
+Join our support channel for updates and assistance.
+        """
+
+_ADMIN_WELCOME_MSG = """
+👑 **Admin Panel**
+
+**Available Commands:**
+• `/addprem [user_id]` - Add premium user
+• `/addpro [user_id]` - Add pro user
+• `/deleteprem [user_id]` - Remove premium/pro
+• `/broadcast [message]` - Broadcast to all users
+• `/batch [link]` - Batch download (for testing)
+
+**Quick Actions:**
+        """
+
+_BATCH_INSTRUCTIONS_MSG = """
+📦 **Batch Download**
+
+**Usage:** `/batch [telegram_link]`
+
+**Examples:**
+• `/batch https://t.me/channel/123`
+• `/batch @channel 123`
+
+**Features:**
+• Downloads multiple recent posts
+• Available for Premium/Pro users only
+• Maintains original quality
+• Automatic file organization
+
+**Note:** This may take several minutes depending on the number of files.
+        """
+
+_LOGIN_INSTRUCTIONS_MSG = """
+🔐 **Login Process**
+
+To use this bot, you need to login with your Telegram account. This allows the bot to access channels you're a member of and download content on your behalf.
+
+**Your privacy is protected:**
+• We don't store your messages
+• Only you can access your account
+• Your session is stored securely
+
+Click **📱 Share My Number** below to start the login process.
+        """
+
+# Plan details shared by the payment, upgrade and limits messages
+_PLAN_META = {
+    "premium": {"plan_name": "Premium", "amount": "$5", "downloads": "50", "size": "2GB", "dl_int": 50},
+    "pro": {"plan_name": "Pro", "amount": "$15", "downloads": "200", "size": "5GB", "dl_int": 200}
+}
+
+_PAYMENT_HEADER_TEMPLATE = """
 💳 **Payment Instructions - {plan_name} Plan**
 
 **Plan:** {plan_name}
@@ -264,11 +379,11 @@ Contact @official_kango for any payment issues.
 **Downloads:** {downloads} per day
 **File Size:** Up to {size}
 
-**Payment Method:** {method.upper()}
+**Payment Method:** {method}
         """
-        
-        if method == "mtn":
-            instructions += f"""
+
+_PAYMENT_TEMPLATES = {
+    "mtn": """
 📱 **MTN Mobile Money:**
 Send {amount} to:
 `{payment_info}`
@@ -279,9 +394,8 @@ Send {amount} to:
 1. Take a screenshot
 2. Contact @official_kango with your screenshot
 3. Wait for verification (1-6 hours)
-            """
-        elif method == "vodafone":
-            instructions += f"""
+            """,
+    "vodafone": """
 📱 **Vodafone Cash:**
 Send {amount} to:
 `{payment_info}`
@@ -292,9 +406,8 @@ Send {amount} to:
 1. Take a screenshot
 2. Contact @official_kango with your screenshot
 3. Wait for verification (1-6 hours)
-            """
-        elif method == "bitcoin":
-            instructions += f"""
+            """,
+    "bitcoin": """
 ₿ **Bitcoin:**
 Send {amount} worth of BTC to:
 `{payment_info}`
@@ -305,9 +418,8 @@ Send {amount} worth of BTC to:
 1. Take a screenshot of transaction
 2. Contact @official_kango with your screenshot
 3. Wait for verification (1-6 hours)
-            """
-        elif method == "usdt":
-            instructions += f"""
+            """,
+    "usdt": """
 💎 **USDT (TRC20):**
 Send {amount} worth of USDT to:
 `{payment_info}`
@@ -318,9 +430,8 @@ Send {amount} worth of USDT to:
 1. Take a screenshot of transaction
 2. Contact @official_kango with your screenshot
 3. Wait for verification (1-6 hours)
-            """
-        elif method == "selar":
-            instructions += f"""
+            """,
+    "selar": """
 🌍 **International Payments:**
 Pay via Selar: {payment_info}
 
@@ -331,39 +442,82 @@ Pay via Selar: {payment_info}
 2. Contact @official_kango with your screenshot
 3. Wait for verification
             """
-        
-        instructions += f"""
+}
+
+_PAYMENT_FOOTER = """
 
 **Contact Admin:** @official_kango
 **Verification Time:** 1-6 hours
 
 Thank you for your purchase!
         """
+
+_PREMIUM_ADDED_TEMPLATE = """
+🎉 **Congratulations!**
+
+✅ **You've been upgraded to {plan_name}!**
+
+**Your new benefits:**
+• {downloads} downloads per day
+• Files up to {size}
+• Batch downloads
+• No cooldown
+• Priority support
+
+**Thank you for choosing our service!**
+
+Start downloading with your new {plan_name_lower} benefits!
+        """
+
+# Upgrade confirmations are fully formatted once per plan
+_PREMIUM_ADDED = {
+    plan_type: _PREMIUM_ADDED_TEMPLATE.format(plan_name_lower=plan["plan_name"].lower(), **plan)
+    for plan_type, plan in _PLAN_META.items()
+}
+
+# (max downloads, max file size, account label, cooldown) per tier
+_LIMITS_TABLE = {
+    "admin": ("Unlimited", "Unlimited", "👑 Admin User", "None"),
+    "pro": (_PLAN_META["pro"]["dl_int"], _PLAN_META["pro"]["size"], "🚀 Pro User", "None"),
+    "premium": (_PLAN_META["premium"]["dl_int"], _PLAN_META["premium"]["size"], "💎 Premium User", "None"),
+    "free": (5, "500MB", "🆓 Free User", "20 seconds")
+}
+
+class Messages:
+    @staticmethod
+    def get_welcome_message():
+        return _WELCOME_MSG
+    
+    @staticmethod
+    def get_premium_info_message():
+        return _PREMIUM_INFO_MSG
+    
+    @staticmethod
+    def get_all_payment_methods_message():
+        """All payment methods in one message - UPDATED TO REDIRECT"""
+        return _ALL_PAYMENT_METHODS_MSG
+    
+    @staticmethod
+    def get_payment_instructions(method, plan_type, payment_info):
+        plan = _PLAN_META["premium" if plan_type == "premium" else "pro"]
+        
+        instructions = _PAYMENT_HEADER_TEMPLATE.format(method=method.upper(), **plan)
+        instructions += _PAYMENT_TEMPLATES.get(method, "").format(amount=plan["amount"], payment_info=payment_info)
+        instructions += _PAYMENT_FOOTER
         
         return instructions
     
     @staticmethod
     def get_download_limits_message(user_data):
-        max_downloads = 5
-        max_size = "500MB"
-        user_type = "🆓 Free User"
-        cooldown = "20 seconds"
-        
         if user_data.get('is_admin', False) or user_data['user_id'] in Config.ADMIN_IDS:
-            max_downloads = "Unlimited"
-            max_size = "Unlimited"
-            user_type = "👑 Admin User"
-            cooldown = "None"
+            tier = "admin"
         elif user_data.get('is_pro', False):
-            max_downloads = 200
-            max_size = "5GB"
-            user_type = "🚀 Pro User"
-            cooldown = "None"
+            tier = "pro"
         elif user_data.get('is_premium', False):
-            max_downloads = 50
-            max_size = "2GB" 
-            user_type = "💎 Premium User"
-            cooldown = "None"
+            tier = "premium"
+        else:
+            tier = "free"
+        max_downloads, max_size, user_type, cooldown = _LIMITS_TABLE[tier]
         
         used = user_data.get('download_count', 0)
         
@@ -381,110 +535,25 @@ Thank you for your purchase!
 **Max File Size:** {max_size}
 **Cooldown:** {cooldown}
 
-{'💎 **Upgrade to Premium for more benefits!**' if user_type == "🆓 Free User" else '✅ **You have premium benefits!**'}
+{'💎 **Upgrade to Premium for more benefits!**' if tier == "free" else '✅ **You have premium benefits!**'}
         """
     
     @staticmethod
     def get_help_message():
-        return """
-ℹ️ **Help Center**
-
-**How to Use:**
-1. Click **🔐 Login** and share your phone number
-2. Click **📥 Download** or **⚡ Forward**
-3. Send any Telegram link
-
-**Download vs Forward:**
-• **📥 Download** - Downloads file to server, then sends to you
-• **⚡ Forward** - Copies content directly (faster, no size limits)
-
-**Supported Links:**
-• `t.me/username/123` - Public channels
-• `t.me/c/123456789/2` - Private channels  
-• `@username/123` - Short format
-
-**Commands:**
-• `/start` - Start the bot
-• `/forward` - Fast forward content
-• `/batch` - Batch download (Premium/Pro only)
-• `/addprem` - Add premium user (Admin only)
-• `/addpro` - Add pro user (Admin only)
-• `/deleteprem` - Remove premium/pro (Admin only)
-• `/broadcast` - Broadcast message (Admin only)
-
-**Need Help?**
-Join our support channel for updates and assistance.
-        """
+        return _HELP_MSG
     
     @staticmethod
     def get_admin_welcome_message():
-        return """
-👑 **Admin Panel**
-
-**Available Commands:**
-• `/addprem [user_id]` - Add premium user
-• `/addpro [user_id]` - Add pro user
-• `/deleteprem [user_id]` - Remove premium/pro
-• `/broadcast [message]` - Broadcast to all users
-• `/batch [link]` - Batch download (for testing)
-
-**Quick Actions:**
-        """
+        return _ADMIN_WELCOME_MSG
     
     @staticmethod
     def get_batch_instructions():
-        return """
-📦 **Batch Download**
-
-**Usage:** `/batch [telegram_link]`
-
-**Examples:**
-• `/batch https://t.me/channel/123`
-• `/batch @channel 123`
-
-**Features:**
-• Downloads multiple recent posts
-• Available for Premium/Pro users only
-• Maintains original quality
-• Automatic file organization
-
-**Note:** This may take several minutes depending on the number of files.
-        """
+        return _BATCH_INSTRUCTIONS_MSG
     
     @staticmethod
     def get_premium_added_message(plan_type="premium"):
-        plan_name = "Premium" if plan_type == "premium" else "Pro"
-        downloads = "50" if plan_type == "premium" else "200"
-        size = "2GB" if plan_type == "premium" else "5GB"
-        
-        return f"""
-🎉 **Congratulations!**
-
-✅ **You've been upgraded to {plan_name}!**
-
-**Your new benefits:**
-• {downloads} downloads per day
-• Files up to {size}
-• Batch downloads
-• No cooldown
-• Priority support
-
-**Thank you for choosing our service!**
-
-Start downloading with your new {plan_name.lower()} benefits!
-        """
+        return _PREMIUM_ADDED["premium" if plan_type == "premium" else "pro"]
     
     @staticmethod
     def get_login_instructions():
-        return """
-🔐 **Login Process**
-
-To use this bot, you need to login with your Telegram account. This allows the bot to access channels you're a member of and download content on your behalf.
-
-**Your privacy is protected:**
-• We don't store your messages
-• Only you can access your account
-• Your session is stored securely
-
-Click **📱 Share My Number** below to start the login process.
-        """
\ No newline at end of file
+        return _LOGIN_INSTRUCTIONS_MSG
\ No newline at end of file
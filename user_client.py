@@ -1,94 +1,298 @@
 import os
+import json
+import time
+import queue
+import atexit
 import asyncio
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from collections import OrderedDict
+from functools import lru_cache
+from types import MappingProxyType
 from pyrogram import Client
+from pyrogram.enums import ChatType
 from pyrogram.types import Message, Chat
 from pyrogram.errors import (
     SessionPasswordNeeded, PhoneCodeInvalid,
     PhoneNumberInvalid, FloodWait, ChannelPrivate,
-    UserNotParticipant, ChatAdminRequired
+    UserNotParticipant, ChatAdminRequired, RPCError
 )
 
 from config import Config
 from utils import FileManager
 
+# Callers only enqueue records; a background thread does the formatting and writing
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+log.propagate = False
+_log_queue = queue.Queue()
+log.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# Pyrogram's stream_media works in fixed 1MB chunks; offset/limit count chunks
+STREAM_CHUNK_SIZE = 1024 * 1024
+# Connections used for downloads, including the main client
+CLIENT_POOL_SIZE = 4
+# Parallel file transfers Pyrogram allows per client (its default is 1); also the
+# number of ranges one download is split into
+MAX_CONCURRENT_TRANSMISSIONS = 4
+# Upper bound on chunks handed to a single pwritev call (well under IOV_MAX)
+WRITEV_MAX_CHUNKS = 64
+# Read buffer for upload file handles
+UPLOAD_BUFFER_SIZE = 1024 * 1024
+
+# Username -> chat id cache, persisted between runs
+PEER_CACHE_FILE = os.path.join(Config.SESSION_DIR, "peer_cache.json")
+PEER_CACHE_SIZE = 4096
+
+# Joined channels snapshot, used at startup while the live list refreshes
+DIALOG_CACHE_FILE = os.path.join(Config.SESSION_DIR, "dialogs.json")
+DIALOG_CACHE_MAX_AGE = 24 * 60 * 60
+
+# Outbound send limits, kept under Telegram's 30 msg/s and 1 msg/s per chat caps
+GLOBAL_SENDS_PER_SECOND = 25
+PER_USER_SEND_INTERVAL = 1.0
+FLOOD_WAIT_RETRIES = 3
+
+# messages.GetMessages accepts at most this many IDs per call
+MESSAGES_PER_REQUEST = 100
+
+# Dialog types kept in joined_channels
+_ALLOWED_CHAT_TYPES = frozenset({ChatType.CHANNEL, ChatType.GROUP, ChatType.SUPERGROUP})
+
+# Upload extensions by media kind; anything else is sent as a document
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+_PHOTO_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff'})
+_AUDIO_EXTS = frozenset({'.mp3', '.ogg', '.m4a', '.wav', '.flac', '.aac'})
+
+# File extension -> Client send method used by upload_file
+_EXT_DISPATCH = MappingProxyType({
+    **dict.fromkeys(_VIDEO_EXTS, 'send_video'),
+    **dict.fromkeys(_PHOTO_EXTS, 'send_photo'),
+    **dict.fromkeys(_AUDIO_EXTS, 'send_audio'),
+})
+
+# Message media attributes in detection order, with each one's fallback extension;
+# documents (None) fall back to their mime subtype
+_MEDIA_TYPES = (
+    ('video', 'mp4'),
+    ('document', None),
+    ('audio', 'mp3'),
+    ('photo', 'jpg'),
+    ('sticker', 'webp'),
+    ('animation', 'mp4'),
+    ('voice', 'ogg'),
+)
+_MEDIA_DEFAULT_EXT = MappingProxyType(dict(_MEDIA_TYPES))
+
+# Mime subtype -> file extension for common documents
+_MIME_EXT_MAP = MappingProxyType({
+    'vnd.android.package-archive': 'apk',
+    'octet-stream': 'bin',
+    'zip': 'zip',
+    'pdf': 'pdf',
+    'msword': 'doc',
+    'vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'vnd.ms-excel': 'xls',
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
+    'vnd.ms-powerpoint': 'ppt',
+    'vnd.openxmlformats-officedocument.presentationml.presentation': 'pptx'
+})
+
+# Media type -> default file extension
+_TYPE_EXT_MAP = MappingProxyType({
+    'video': 'mp4',
+    'audio': 'mp3',
+    'photo': 'jpg',
+    'sticker': 'webp',
+    'animation': 'mp4',
+    'voice': 'ogg',
+    'video_note': 'mp4'
+})
+
+def _open_for_upload(path: str):
+    """Open a file for streaming upload; return (file or None, size, basename, lowercase extension)"""
+    filename = os.path.basename(path)
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        f = open(path, 'rb', buffering=UPLOAD_BUFFER_SIZE)
+    except FileNotFoundError:
+        return None, 0, filename, ext
+    size = os.fstat(f.fileno()).st_size
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f, size, filename, ext
+
+def _pwritev_all(fd: int, buffers: list, offset: int) -> int:
+    """pwritev that fails loudly on a short write; returns the bytes written"""
+    expected = sum(len(buffer) for buffer in buffers)
+    written = os.pwritev(fd, buffers, offset)
+    if written != expected:
+        raise OSError(f"Short write: {written} of {expected} bytes at offset {offset}")
+    return written
+
+def _prefetch_file(path: str):
+    """Ask the kernel to read a file into the page cache ahead of an upload"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+def _file_extension(mime_type, media_type: str) -> str:
+    """Get proper file extension based on media type and mime type"""
+    # Try to get extension from mime type first
+    if mime_type:
+        mime_parts = mime_type.split('/')
+        if len(mime_parts) == 2:
+            ext = mime_parts[1]
+            # Clean up common mime type to extension mappings
+            return _MIME_EXT_MAP.get(ext, ext)
+    
+    # Fallback to type-based extensions
+    return _TYPE_EXT_MAP.get(media_type, 'bin')
+
+@lru_cache(maxsize=4096)
+def _cached_filename(message_id: int, file_type: str, mime_type, file_name) -> str:
+    """Build a download filename from a message's primitive media fields (retries hit the cache)"""
+    # If file has original filename, use it
+    if file_name:
+        return FileManager.clean_filename(file_name)
+    
+    # Otherwise generate filename with proper extension
+    file_ext = _file_extension(mime_type, file_type)
+    if file_ext == 'bin':
+        file_ext = _MEDIA_DEFAULT_EXT[file_type] or (mime_type.split('/')[-1] if mime_type else "bin")
+    
+    return f"{file_type}_{message_id}.{file_ext}"
+
 class UserBotClient:
     def __init__(self):
         self.client = None
         self.is_connected = False
         self.joined_channels = []
+        self._download_dir = Config.DOWNLOAD_DIR
+        os.makedirs(self._download_dir, exist_ok=True)
+        # Lowercased search keys, parallel to joined_channels
+        self._titles_lower = []
+        self._usernames_lower = []
+        self._peer_cache = OrderedDict()
+        # Send rate limiting, set up in start()
+        self._global_sem = None
+        self._global_sent = 0
+        self._refill_task = None
+        self._dialogs_task = None
+        self._user_buckets = {}  # {user_id: time of the next allowed send}
+        # Extra connections on the same authorization, used round-robin for downloads
+        self._client_pool = []
+        self._pool_index = 0
     
     async def start(self):
         """Start user bot with automatic authentication"""
         try:
-            print("🔐 Starting user bot authentication...")
+            log.info("🔐 Starting user bot authentication...")
             
             self.client = Client(
                 Config.USER_SESSION,
                 api_id=Config.API_ID,
                 api_hash=Config.API_HASH,
-                workdir="sessions"
+                workdir="sessions",
+                max_concurrent_transmissions=MAX_CONCURRENT_TRANSMISSIONS
             )
             
             await self.client.start()
             self.is_connected = True
+            self._load_peer_cache()
+            self._global_sem = asyncio.Semaphore(GLOBAL_SENDS_PER_SECOND)
+            self._refill_task = asyncio.create_task(self._refill())
             
             me = await self.client.get_me()
-            print(f"✅ User bot authenticated as: {me.first_name}")
+            log.info("✅ User bot authenticated as: %s", me.first_name)
+            
+            await self._start_client_pool()
             
-            # Load joined channels
-            await self.load_joined_channels()
+            # Serve channels from the snapshot and refresh in the background;
+            # without a fresh snapshot, wait for the full dialog list
+            if self._load_dialog_cache():
+                self._dialogs_task = asyncio.create_task(self.load_joined_channels())
+            else:
+                await self.load_joined_channels()
             
             return True
             
         except Exception as e:
-            print(f"❌ User bot failed: {e}")
+            log.error("❌ User bot failed: %s", e)
             return False
     
     async def load_joined_channels(self):
         """Load all channels and groups the user is member of"""
         try:
-            print("📋 Loading your channels and groups...")
-            self.joined_channels = []
-            
-            async for dialog in self.client.get_dialogs():
-                if dialog.chat.type in ["channel", "group", "supergroup"]:
-                    channel_info = {
-                        'id': dialog.chat.id,
-                        'title': dialog.chat.title,
-                        'username': getattr(dialog.chat, 'username', None),
-                        'type': dialog.chat.type,
-                        'is_restricted': getattr(dialog.chat, 'is_restricted', False)
-                    }
-                    self.joined_channels.append(channel_info)
+            log.info("📋 Loading your channels and groups...")
+            # get_dialogs already pages 100 dialogs per request; each page's
+            # offset comes from the previous one, so pages cannot be fetched in parallel.
+            # Build the new list in one pass and swap it in, so searches never see a half-filled list
+            self.joined_channels = [
+                {
+                    'id': dialog.chat.id,
+                    'title': dialog.chat.title,
+                    'username': getattr(dialog.chat, 'username', None),
+                    'type': dialog.chat.type,
+                    'is_restricted': getattr(dialog.chat, 'is_restricted', False)
+                }
+                async for dialog in self.client.get_dialogs()
+                if dialog.chat.type in _ALLOWED_CHAT_TYPES
+            ]
             
-            print(f"✅ Loaded {len(self.joined_channels)} channels/groups")
+            self._build_search_index()
+            for channel in self.joined_channels:
+                if channel['username']:
+                    self._remember_peer(channel['username'], channel['id'])
+            log.info("✅ Loaded %s channels/groups", len(self.joined_channels))
+            # Snapshot only a live list, so the file's mtime is the time it was fetched
+            await asyncio.to_thread(self._save_dialog_cache)
             
         except Exception as e:
-            print(f"❌ Failed to load channels: {e}")
+            log.error("❌ Failed to load channels: %s", e)
     
     async def get_joined_channels(self):
         """Get list of joined channels"""
         return self.joined_channels
     
+    def _build_search_index(self):
+        """Precompute lowercased titles and usernames for search_channels"""
+        self._titles_lower = [(channel['title'] or "").lower() for channel in self.joined_channels]
+        self._usernames_lower = [(channel['username'] or "").lower() for channel in self.joined_channels]
+    
     async def search_channels(self, query: str):
         """Search channels by title or username"""
-        results = []
-        for channel in self.joined_channels:
-            if (query.lower() in channel['title'].lower() or 
-                (channel['username'] and query.lower() in channel['username'].lower())):
-                results.append(channel)
-        return results
+        q = query.lower()
+        usernames = self._usernames_lower
+        channels = self.joined_channels
+        return [
+            channels[i] for i, title in enumerate(self._titles_lower)
+            if q in title or (usernames[i] and q in usernames[i])
+        ]
     
-    async def download_file(self, chat_id: str, message_id: int) -> str:
+    async def download_file(self, chat_id: str, message_id: int, message: Message = None) -> str:
         """Download file from Telegram with proper filename handling"""
         if not self.is_connected:
             raise Exception("User bot not connected")
         
         try:
-            # Get the message
-            message = await self.client.get_messages(chat_id, message_id)
+            # Get the message, unless the caller already fetched it in bulk
+            if message is None:
+                message = await self.client.get_messages(self._cached_peer(chat_id), message_id)
             if not message or getattr(message, 'empty', False):
                 raise Exception("Message not found or inaccessible")
+            if isinstance(chat_id, str) and message.chat:
+                self._remember_peer(chat_id, message.chat.id)
             
             # Check if message has media
             if not any([message.video, message.document, message.audio, message.photo, message.sticker, message.animation, message.voice]):
@@ -96,16 +300,16 @@ class UserBotClient:
             
             # Generate proper filename with correct extension
             filename = await self._generate_filename(message)
-            file_path = os.path.join("downloads", filename)
+            file_path = os.path.join(self._download_dir, filename)
             
             # Download file
-            print(f"📥 Downloading: {filename}")
-            download_path = await message.download(file_name=file_path)
+            log.info("📥 Downloading: %s", filename)
+            download_path = await self._download_parallel(message, file_path, self._next_client())
             
             # Verify the file was downloaded and has correct extension
             if download_path and os.path.exists(download_path):
                 actual_filename = os.path.basename(download_path)
-                print(f"✅ Download completed: {actual_filename}")
+                log.info("✅ Download completed: %s", actual_filename)
                 return download_path
             else:
                 raise Exception("Download failed - file not found after download")
@@ -119,76 +323,221 @@ class UserBotClient:
         except Exception as e:
             raise Exception(f"Download failed: {str(e)}")
     
+    async def _download_parallel(self, message: Message, file_path: str, client: Client,
+                                 concurrency: int = MAX_CONCURRENT_TRANSMISSIONS) -> str:
+        """Download media as a few contiguous ranges in parallel, each written at its own offset"""
+        media = (message.video or message.document or message.audio or message.photo or
+                 message.sticker or message.animation or message.voice)
+        file_size = getattr(media, 'file_size', 0) or 0
+        
+        # Unknown size or no vectored positional writes: use Pyrogram's sequential download
+        if not file_size or not hasattr(os, 'pwritev'):
+            return await client.download_media(message, file_name=file_path)
+        
+        # Each stream_media call opens its own media session (and, on another DC, its own
+        # authorization), so split the file into one contiguous range per worker, not per chunk.
+        # Pyrogram runs at most max_concurrent_transmissions of these at once per client
+        total_chunks = (file_size + STREAM_CHUNK_SIZE - 1) // STREAM_CHUNK_SIZE
+        workers = min(concurrency, total_chunks)
+        per_worker = (total_chunks + workers - 1) // workers
+        ranges = [
+            (start, min(per_worker, total_chunks - start))
+            for start in range(0, total_chunks, per_worker)
+        ]
+        
+        # Chunks a worker buffers before one pwritev; keeps all workers under the in-flight cap
+        batch_chunks = max(1, min(WRITEV_MAX_CHUNKS, Config.DOWNLOAD_MAX_INFLIGHT_BYTES // STREAM_CHUNK_SIZE // len(ranges)))
+        
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        completed = False
+        loop = asyncio.get_running_loop()
+        # Cancelling a worker does not stop its thread, so the fd stays open until every write returns
+        writes = set()
+        
+        async def write(batch, position):
+            future = loop.run_in_executor(None, _pwritev_all, fd, batch, position)
+            writes.add(future)
+            future.add_done_callback(writes.discard)
+            return await asyncio.shield(future)
+        
+        async def worker(start, count):
+            position = start * STREAM_CHUNK_SIZE
+            batch = []
+            received = 0
+            async for chunk in client.stream_media(message, offset=start, limit=count):
+                batch.append(chunk)
+                received += 1
+                if len(batch) >= batch_chunks:
+                    position += await write(batch, position)
+                    batch = []
+            if batch:
+                await write(batch, position)
+            if received < count:
+                raise Exception(f"Download incomplete: chunk {start + received} missing")
+        
+        try:
+            # Reserve the full size up front so the file does not fragment as it grows
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, file_size)
+            else:
+                os.ftruncate(fd, file_size)
+            
+            tasks = [asyncio.create_task(worker(start, count)) for start, count in ranges]
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                # Stop the remaining workers if one of them failed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            
+            completed = True
+            return file_path
+        finally:
+            if writes:
+                await asyncio.wait(set(writes))
+            os.close(fd)
+            if not completed:
+                FileManager.cleanup_file(file_path)
+    
     async def upload_file(self, user_id: int, file_path: str, caption: str = "") -> Message:
         """Upload file to user with proper file type detection"""
         if not self.is_connected:
             raise Exception("User bot not connected")
         
-        if not os.path.exists(file_path):
+        upload_file, file_size, filename, file_ext = await asyncio.get_running_loop().run_in_executor(
+            None, _open_for_upload, file_path
+        )
+        if upload_file is None:
             raise Exception("File not found")
         
-        filename = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path)
-        print(f"📤 Uploading: {filename} ({file_size/1024/1024:.1f}MB)")
+        log.info("📤 Uploading: %s (%.1fMB)", filename, file_size/1024/1024)
         
-        file_ext = os.path.splitext(file_path)[1].lower()
         upload_kwargs = {'caption': caption} if caption else {}
         
         try:
-            # Determine file type and upload accordingly
-            if file_ext in ['.mp4', '.avi', '.mov', '.mkv', '.webm']:
-                # Send as video
-                message = await self.client.send_video(
-                    user_id, 
-                    file_path,
-                    **upload_kwargs
-                )
-            elif file_ext in ['.jpg', '.jpeg', '.png', '.webp', '.bmp', '.tiff']:
-                # Send as photo
-                message = await self.client.send_photo(
-                    user_id,
-                    file_path,
-                    **upload_kwargs
-                )
-            elif file_ext in ['.mp3', '.ogg', '.m4a', '.wav', '.flac', '.aac']:
-                # Send as audio
-                message = await self.client.send_audio(
-                    user_id,
-                    file_path,
-                    **upload_kwargs
-                )
-            elif file_ext in ['.apk']:
-                # Send APK as document but with proper thumbnail
-                message = await self.client.send_document(
-                    user_id,
-                    file_path,
-                    **upload_kwargs
-                )
-            else:
-                # Send as document with original filename
-                message = await self.client.send_document(
-                    user_id,
-                    file_path,
-                    **upload_kwargs
-                )
+            # Pick the send method from the extension; anything else is a document
+            method = _EXT_DISPATCH.get(file_ext, 'send_document')
+            send = getattr(self.client, method)
+            # A file object has no clean name of its own; send_photo takes no file_name
+            send_kwargs = upload_kwargs if method == 'send_photo' else {**upload_kwargs, 'file_name': filename}
+            message = await self._send_rate_limited(send, user_id, upload_file, **send_kwargs)
             
-            print(f"✅ Upload completed: {filename}")
+            log.info("✅ Upload completed: %s", filename)
             return message
             
-        except Exception as e:
-            print(f"❌ Upload failed: {e}")
+        except FloodWait:
+            # Already retried inside _send_rate_limited; a fallback would hit the same wait
+            raise
+        except (TimeoutError, RPCError) as e:
+            # Only transport/API errors are worth a retry; OSError (file gone mid-upload)
+            # propagates, and a failed document send would just fail again
+            if method == 'send_document':
+                raise
+            log.error("❌ Upload failed: %s", e)
             # Fallback: send as document
             try:
-                message = await self.client.send_document(
+                upload_file.seek(0)
+                message = await self._send_rate_limited(
+                    self.client.send_document,
                     user_id,
-                    file_path,
+                    upload_file,
+                    file_name=filename,
                     **upload_kwargs
                 )
-                print(f"✅ Upload completed (fallback): {filename}")
+                log.info("✅ Upload completed (fallback): %s", filename)
                 return message
             except Exception as fallback_error:
-                print(f"❌ Fallback upload also failed: {fallback_error}")
+                log.error("❌ Fallback upload also failed: %s", fallback_error)
                 raise
+        finally:
+            upload_file.close()
+    
+    async def pipe_download_upload(self, chat_id: str, message_ids: list, user_id: int, caption: str = "") -> list:
+        """Download the next file while the current one uploads (double-buffered)"""
+        if not self.is_connected:
+            raise Exception("User bot not connected")
+        
+        # Fetch every message up front instead of one request per file
+        messages = await self.get_messages_bulk(chat_id, message_ids)
+        
+        # Two slots: one file uploading, one prefetched and waiting
+        ready = asyncio.Queue(maxsize=2)
+        
+        async def producer():
+            for message_id, message in zip(message_ids, messages):
+                try:
+                    file_path = await self.download_file(chat_id, message_id, message)
+                except Exception as e:
+                    log.error("❌ Failed to download message %s: %s", message_id, e)
+                    continue
+                try:
+                    await ready.put(file_path)
+                except asyncio.CancelledError:
+                    # The consumer stopped reading; this file never reaches the queue
+                    FileManager.cleanup_file(file_path)
+                    raise
+            # No sentinel when cancelled: nobody reads it, and a full queue would block forever
+            await ready.put(None)
+        
+        producer_task = asyncio.create_task(producer())
+        sent = []
+        try:
+            while (file_path := await ready.get()) is not None:
+                try:
+                    _prefetch_file(file_path)
+                    sent.append(await self.upload_file(user_id, file_path, caption))
+                except Exception as e:
+                    log.error("❌ Failed to upload %s: %s", file_path, e)
+                finally:
+                    FileManager.cleanup_file(file_path)
+        finally:
+            producer_task.cancel()
+            await asyncio.gather(producer_task, return_exceptions=True)
+            # Remove files that were prefetched but never uploaded
+            while not ready.empty():
+                leftover = ready.get_nowait()
+                if leftover:
+                    FileManager.cleanup_file(leftover)
+        
+        return sent
+    
+    async def _refill(self):
+        """Top the global send semaphore back up once per second"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(1)
+            sent, self._global_sent = self._global_sent, 0
+            for _ in range(sent):
+                self._global_sem.release()
+            # Forget users whose last send slot is long past
+            now = loop.time()
+            for user_id in [u for u, slot in self._user_buckets.items() if slot < now - 60]:
+                del self._user_buckets[user_id]
+    
+    async def _await_user_slot(self, user_id: int):
+        """Wait for this user's next send slot (at most one send per interval)"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._user_buckets.get(user_id, 0) + PER_USER_SEND_INTERVAL)
+        self._user_buckets[user_id] = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    async def _send_rate_limited(self, send, user_id: int, *args, **kwargs):
+        """Call a send_* method within the global and per-user limits, retrying on FloodWait"""
+        for attempt in range(FLOOD_WAIT_RETRIES):
+            # Permits are returned by _refill, not on completion
+            await self._global_sem.acquire()
+            self._global_sent += 1
+            await self._await_user_slot(user_id)
+            try:
+                return await send(user_id, *args, **kwargs)
+            except FloodWait as e:
+                if attempt == FLOOD_WAIT_RETRIES - 1:
+                    raise
+                log.warning("⏳ FloodWait: sleeping %ss before retrying", e.value)
+                await asyncio.sleep(e.value)
     
     async def get_message(self, chat_id: str, message_id: int) -> Message:
         """Get message from Telegram - works with both usernames and chat IDs"""
@@ -196,9 +545,11 @@ class UserBotClient:
             raise Exception("User bot not connected")
         
         try:
-            message = await self.client.get_messages(chat_id, message_id)
+            message = await self.client.get_messages(self._cached_peer(chat_id), message_id)
             if not message or getattr(message, 'empty', False):
                 raise Exception("Message not found or inaccessible")
+            if isinstance(chat_id, str) and message.chat:
+                self._remember_peer(chat_id, message.chat.id)
             return message
             
         except ChannelPrivate:
@@ -208,87 +559,165 @@ class UserBotClient:
         except Exception as e:
             raise Exception(f"❌ Cannot access message: {str(e)}")
     
+    async def get_messages_bulk(self, chat_id: str, message_ids: list) -> list:
+        """Get many messages from one chat, up to 100 per request"""
+        if not self.is_connected:
+            raise Exception("User bot not connected")
+        
+        peer = self._cached_peer(chat_id)
+        batches = [message_ids[i:i + MESSAGES_PER_REQUEST] for i in range(0, len(message_ids), MESSAGES_PER_REQUEST)]
+        
+        try:
+            results = await asyncio.gather(*(self.client.get_messages(peer, batch) for batch in batches))
+        except ChannelPrivate:
+            raise Exception("❌ Channel is private. Make sure you're a member and have access.")
+        except UserNotParticipant:
+            raise Exception("❌ You're not a member of this channel. Join the channel first.")
+        except Exception as e:
+            raise Exception(f"❌ Cannot access messages: {str(e)}")
+        
+        messages = [message for batch in results for message in batch]
+        if isinstance(chat_id, str):
+            for message in messages:
+                if message.chat:
+                    self._remember_peer(chat_id, message.chat.id)
+                    break
+        return messages
+    
+    async def get_messages_multi(self, grouped: dict) -> dict:
+        """Get messages from several chats at once: {chat_id: [message_ids]} -> {chat_id: [messages]}"""
+        results = await asyncio.gather(
+            *(self.get_messages_bulk(chat_id, ids) for chat_id, ids in grouped.items())
+        )
+        return dict(zip(grouped, results))
+    
     async def _generate_filename(self, message: Message) -> str:
         """Generate proper filename with correct extension"""
-        if message.video:
-            media = message.video
-            file_type = "video"
-            default_ext = "mp4"
-        elif message.document:
-            media = message.document
-            file_type = "document"
-            default_ext = media.mime_type.split('/')[-1] if media.mime_type else "bin"
-        elif message.audio:
-            media = message.audio
-            file_type = "audio"
-            default_ext = "mp3"
-        elif message.photo:
-            media = message.photo
-            file_type = "photo"
-            default_ext = "jpg"
-        elif message.sticker:
-            media = message.sticker
-            file_type = "sticker"
-            default_ext = "webp"
-        elif message.animation:
-            media = message.animation
-            file_type = "animation"
-            default_ext = "mp4"
-        elif message.voice:
-            media = message.voice
-            file_type = "voice"
-            default_ext = "ogg"
+        for file_type, _ in _MEDIA_TYPES:
+            media = getattr(message, file_type, None)
+            if media:
+                break
         else:
             return f"file_{message.id}.bin"
         
-        # If file has original filename, use it
-        if hasattr(media, 'file_name') and media.file_name:
-            return FileManager.clean_filename(media.file_name)
-        
-        # Otherwise generate filename with proper extension
-        file_ext = self._get_file_extension(media, file_type)
-        if file_ext == 'bin':
-            file_ext = default_ext
-        
-        return f"{file_type}_{message.id}.{file_ext}"
+        return _cached_filename(
+            message.id, file_type,
+            getattr(media, 'mime_type', None), getattr(media, 'file_name', None)
+        )
     
-    def _get_file_extension(self, media_obj, media_type: str) -> str:
-        """Get proper file extension based on media type and mime type"""
-        # Try to get extension from mime type first
-        if hasattr(media_obj, 'mime_type') and media_obj.mime_type:
-            mime_parts = media_obj.mime_type.split('/')
-            if len(mime_parts) == 2:
-                ext = mime_parts[1]
-                # Clean up common mime type to extension mappings
-                ext_mapping = {
-                    'vnd.android.package-archive': 'apk',
-                    'octet-stream': 'bin',
-                    'zip': 'zip',
-                    'pdf': 'pdf',
-                    'msword': 'doc',
-                    'vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
-                    'vnd.ms-excel': 'xls',
-                    'vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
-                    'vnd.ms-powerpoint': 'ppt',
-                    'vnd.openxmlformats-officedocument.presentationml.presentation': 'pptx'
-                }
-                return ext_mapping.get(ext, ext)
+    def _cached_peer(self, chat_id):
+        """Swap a cached username for its chat id to skip the resolve RPC"""
+        if not isinstance(chat_id, str):
+            return chat_id
+        key = chat_id.lstrip('@').lower()
+        peer_id = self._peer_cache.get(key)
+        if peer_id is None:
+            return chat_id
+        self._peer_cache.move_to_end(key)
+        return peer_id
+    
+    def _remember_peer(self, username: str, peer_id: int):
+        """Cache a username -> chat id mapping, evicting the oldest entries"""
+        key = username.lstrip('@').lower()
+        self._peer_cache[key] = peer_id
+        self._peer_cache.move_to_end(key)
+        while len(self._peer_cache) > PEER_CACHE_SIZE:
+            self._peer_cache.popitem(last=False)
+    
+    def _load_peer_cache(self):
+        """Load the persisted peer cache, if any"""
+        try:
+            with open(PEER_CACHE_FILE, "r", encoding="utf-8") as f:
+                self._peer_cache = OrderedDict(json.load(f))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            log.warning("⚠️ Could not load peer cache: %s", e)
+    
+    def _save_peer_cache(self):
+        """Persist the peer cache for the next run"""
+        try:
+            with open(PEER_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump(list(self._peer_cache.items()), f)
+        except Exception as e:
+            log.warning("⚠️ Could not save peer cache: %s", e)
+    
+    def _load_dialog_cache(self) -> bool:
+        """Load the joined channels snapshot if it is less than a day old"""
+        try:
+            if time.time() - os.path.getmtime(DIALOG_CACHE_FILE) > DIALOG_CACHE_MAX_AGE:
+                return False
+            with open(DIALOG_CACHE_FILE, "r", encoding="utf-8") as f:
+                channels = json.load(f)
+            for channel in channels:
+                channel['type'] = ChatType(channel['type'])
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            log.warning("⚠️ Could not load dialog cache: %s", e)
+            return False
         
-        # Fallback to type-based extensions
-        extensions = {
-            'video': 'mp4',
-            'audio': 'mp3',
-            'photo': 'jpg',
-            'sticker': 'webp',
-            'animation': 'mp4',
-            'voice': 'ogg',
-            'video_note': 'mp4'
-        }
+        self.joined_channels = channels
+        self._build_search_index()
+        log.info("✅ Loaded %s channels/groups from cache", len(channels))
+        return True
+    
+    def _save_dialog_cache(self):
+        """Persist the joined channels for the next startup"""
+        try:
+            with open(DIALOG_CACHE_FILE, "w", encoding="utf-8") as f:
+                json.dump([{**channel, 'type': channel['type'].value} for channel in self.joined_channels], f)
+        except Exception as e:
+            log.warning("⚠️ Could not save dialog cache: %s", e)
+    
+    async def _start_client_pool(self):
+        """Open extra in-memory connections that reuse this session's authorization.
+        Each client has its own transmission limit, so files routed to different clients
+        download side by side instead of queueing on one client's get_file semaphore"""
+        try:
+            session_string = await self.client.export_session_string()
+        except Exception as e:
+            log.warning("⚠️ Download pool disabled: %s", e)
+            return
         
-        return extensions.get(media_type, 'bin')
+        pool = [
+            Client(
+                f"{Config.USER_SESSION}_pool{i}",
+                api_id=Config.API_ID,
+                api_hash=Config.API_HASH,
+                session_string=session_string,
+                in_memory=True,
+                no_updates=True,
+                max_concurrent_transmissions=MAX_CONCURRENT_TRANSMISSIONS
+            )
+            for i in range(CLIENT_POOL_SIZE - 1)
+        ]
+        results = await asyncio.gather(*(client.start() for client in pool), return_exceptions=True)
+        for client, result in zip(pool, results):
+            if isinstance(result, Exception):
+                log.warning("⚠️ Could not start pooled client %s: %s", client.name, result)
+            else:
+                self._client_pool.append(client)
+        log.info("✅ Download pool ready: %s connections", len(self._client_pool) + 1)
+    
+    def _next_client(self) -> Client:
+        """Pick the next download connection, round-robin over the main client and the pool"""
+        self._pool_index = (self._pool_index + 1) % (len(self._client_pool) + 1)
+        return self._client_pool[self._pool_index - 1] if self._pool_index else self.client
     
     async def stop(self):
         """Stop the user bot"""
+        if self._refill_task:
+            self._refill_task.cancel()
+            self._refill_task = None
+        if self._dialogs_task:
+            self._dialogs_task.cancel()
+            self._dialogs_task = None
         if self.client and self.is_connected:
+            self._save_peer_cache()
+            await asyncio.gather(
+                *(client.stop() for client in self._client_pool), return_exceptions=True
+            )
+            self._client_pool = []
             await self.client.stop()
         self.is_connected = False
\ No newline at end of file
@@ -1,14 +1,16 @@
 import os
+import time
 import asyncio
-from pyrogram import Client
+from collections import OrderedDict
+from types import MappingProxyType
+from pyrogram.enums import ChatType
 from pyrogram.types import Message
 from pyrogram.errors import (
     ChannelPrivate, UserNotParticipant, ChatAdminRequired,
     InviteHashInvalid, InviteHashExpired, UsernameNotOccupied,
     AuthKeyUnregistered, SessionExpired, SessionRevoked,
-    PeerIdInvalid
+    PeerIdInvalid, FloodWait
 )
-from pyrogram import raw
 
 from database import DatabaseManager
 from utils import FileManager
@@ -26,44 +28,77 @@ try:
 except Exception as e:
     print(f"⚠️ Could not patch Pyrogram constants: {e}")
 
+# Downloads a batch runs at once; matches the client's max_concurrent_transmissions
+BATCH_DOWNLOAD_CONCURRENCY = 4
+# Messages batch_copy_messages fetches ahead of the one being sent, and FloodWait retries per call
+BATCH_COPY_CONCURRENCY = 6
+FLOOD_WAIT_RETRIES = 3
+
+# How long resolve_peer trusts a hit or a miss, and how many of each it keeps
+PEER_OK_TTL = 20 * 60
+PEER_MISS_TTL = 20
+PEER_CACHE_SIZE = 4096
+
+# Longest gap between progress updates when the whole percentage has not changed
+PROGRESS_MIN_INTERVAL = 3.0
+
+# Dialog types kept in joined_channels; chat.type is a ChatType enum, not a string
+_ALLOWED_CHAT_TYPES = frozenset({ChatType.CHANNEL, ChatType.GROUP, ChatType.SUPERGROUP})
+
+# Mime subtype -> file extension
+_MIME_EXT_MAP = MappingProxyType({
+    'mp4': 'mp4', 'mpeg': 'mp3', 'x-m4a': 'm4a', 'ogg': 'ogg',
+    'webm': 'webm', 'x-matroska': 'mkv', 'quicktime': 'mov',
+    'x-msvideo': 'avi', 'x-flv': 'flv', '3gpp': '3gp',
+    'jpeg': 'jpg', 'png': 'png', 'gif': 'gif', 'webp': 'webp',
+    'pdf': 'pdf', 'zip': 'zip', 'x-rar': 'rar', 'x-7z-compressed': '7z',
+    'vnd.android.package-archive': 'apk',
+    'octet-stream': 'bin',
+    'msword': 'doc',
+    'vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
+    'vnd.ms-excel': 'xls',
+    'vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
+    'vnd.ms-powerpoint': 'ppt',
+    'vnd.openxmlformats-officedocument.presentationml.presentation': 'pptx'
+})
+
+# Media type -> default file extension
+_TYPE_EXT_MAP = MappingProxyType({
+    'video': 'mp4',
+    'audio': 'mp3',
+    'photo': 'jpg',
+    'sticker': 'webp',
+    'animation': 'mp4',
+    'voice': 'ogg',
+    'video_note': 'mp4'
+})
+
 class UserSession:
-    def __init__(self, auth_manager, user_id, bot_client=None):
+    # Peer resolution results shared by all sessions: {(user_id, chat): expiry}.
+    # Sessions are short-lived, and Pyrogram keeps resolved access hashes in the session file
+    _peer_ok = OrderedDict()
+    _peer_miss = OrderedDict()
+    
+    def __init__(self, auth_manager, user_id, bot_client=None, db=None):
         self.auth_manager = auth_manager
         self.user_id = user_id
-        self.db = DatabaseManager()
+        self.db = db or DatabaseManager.get_shared()
         self.bot_client = bot_client  # For sending progress updates
         self.client = None
         self.is_connected = False
-        self.joined_channels = []
+        self.joined_channels = {}  # {chat_id: channel_info}
+        # Bounds concurrent downloads in batch_download
+        self._download_sem = asyncio.Semaphore(BATCH_DOWNLOAD_CONCURRENCY)
     
     async def connect(self):
         """Connect user session with better error handling - FASTER CONNECTION"""
         if not self.auth_manager.is_user_authenticated(self.user_id):
             raise Exception("User not authenticated. Please /login first.")
         
-        self.client = self.auth_manager.get_user_session(self.user_id)
-        if not self.client:
-            raise Exception("Failed to create session client. Please /login again.")
-        
         try:
-            # FASTER: Connect without full startup sequence
-            await self.client.connect()
-            
-            # Quick test without full get_me if possible
-            try:
-                me = await self.client.get_me()
-                print(f"✅ User session connected: {me.first_name} (ID: {me.id})")
-            except:
-                print(f"✅ User session connected: {self.user_id}")
-            
-            self.is_connected = True
-            
-            # Skip loading channels to save time - we'll load on demand
-            # await self.load_joined_channels()
-            
-            # Update last used time
-            self.db.get_user(self.user_id)
-            
+            # Connects under the auth manager's per-user lock, or reuses the client kept alive
+            # since an earlier request, so concurrent requests never connect it twice
+            self.client = await self.auth_manager.get_user_session(self.user_id)
         except (AuthKeyUnregistered, SessionExpired, SessionRevoked) as e:
             # Session is invalid, clean up
             print(f"❌ Session invalid for user {self.user_id}: {e}")
@@ -72,31 +107,49 @@ class UserSession:
         except Exception as e:
             print(f"❌ Failed to connect user session {self.user_id}: {e}")
             raise Exception(f"Failed to connect: {str(e)}")
+        if not self.client:
+            raise Exception("Failed to create session client. Please /login again.")
+        
+        self.is_connected = True
+        print(f"✅ User session ready: {self.user_id}")
+        
+        # Skip loading channels to save time - we'll load on demand
+        # await self.load_joined_channels()
+        
+        try:
+            # Update last used time
+            self.db.get_user(self.user_id)
+        except Exception as e:
+            print(f"❌ Failed to connect user session {self.user_id}: {e}")
+            await self.disconnect()
+            raise Exception(f"Failed to connect: {str(e)}")
     
     async def load_joined_channels(self):
         """Load all channels and groups the user is member of"""
         try:
             print(f"📋 Loading channels and groups for user {self.user_id}...")
-            self.joined_channels = []
+            self.joined_channels = {}
             
             async for dialog in self.client.get_dialogs():
-                if dialog.chat.type in ["channel", "group", "supergroup"]:
-                    channel_info = {
-                        'id': dialog.chat.id,
-                        'title': dialog.chat.title,
-                        'username': getattr(dialog.chat, 'username', None),
-                        'type': dialog.chat.type,
-                        'is_restricted': getattr(dialog.chat, 'is_restricted', False)
+                chat = dialog.chat
+                if chat.type in _ALLOWED_CHAT_TYPES:
+                    # Pyrogram's Chat always sets these attributes, so no getattr fallbacks
+                    self.joined_channels[chat.id] = {
+                        'id': chat.id,
+                        'title': chat.title,
+                        'username': chat.username,
+                        'type': chat.type,
+                        'is_restricted': bool(chat.is_restricted)
                     }
-                    self.joined_channels.append(channel_info)
             
             print(f"✅ Loaded {len(self.joined_channels)} channels/groups for user {self.user_id}")
             
         except Exception as e:
             print(f"❌ Failed to load channels for user {self.user_id}: {e}")
     
-    async def download_file(self, chat_id: str, message_id: int, progress_callback=None) -> str:
-        """Download file using user's session with progress tracking"""
+    async def download_file(self, chat_id: str, message_id: int, progress_callback=None, stats=None) -> str:
+        """Download file using user's session with progress tracking.
+        Batch callers pass a stats list to collect (file_name, file_size) and write them in bulk"""
         if not self.is_connected:
             raise Exception("User session not connected")
         
@@ -109,48 +162,98 @@ class UserSession:
             if not message:
                 raise Exception("Message not found")
             
-            # Check if message has media
-            if not any([message.video, message.document, message.audio, message.photo, message.sticker, message.animation, message.voice]):
+            # Check if message has media; stops at the first media attribute that is set
+            media = (message.video or message.document or message.audio or message.photo or
+                     message.sticker or message.animation or message.voice)
+            if not media:
                 raise Exception("No media found in message")
             
             # Generate proper filename with correct extension
-            filename = await self._generate_filename(message)
-            file_path = os.path.join("downloads", filename)
+            filename = self._generate_filename(message)
+            # One directory per user and message so same-named files never share a path,
+            # while the upload still carries the original name
+            file_path = os.path.join("downloads", f"{self.user_id}_{message.id}", filename)
             
             # Download file with progress
             print(f"📥 User {self.user_id} downloading: {filename}")
             
             # Custom download function with progress
-            download_path = await self._download_with_progress(message, file_path, progress_callback)
+            download_path = await self._download_with_progress(message, file_path, progress_callback, media)
             
-            # Update download stats
-            file_size = os.path.getsize(download_path) if os.path.exists(download_path) else 0
-            self.db.increment_download_count(self.user_id)
-            self.db.add_download_stat(self.user_id, filename, file_size)
+            # Update download stats with the size Telegram reported, no stat needed
+            file_size = getattr(media, 'file_size', 0) or 0
+            if stats is not None:
+                stats.append((filename, file_size))
+            else:
+                await self._record_download(filename, file_size)
             
             print(f"✅ Download completed: {filename}")
             return download_path
             
         except ChannelPrivate:
+            self._forget_peer(chat_id)
             raise Exception("This channel is private and you cannot access it. Please make sure you're a member and have joined the channel.")
         except UserNotParticipant:
             raise Exception("You are not a member of this channel. Please join the channel first to access its content.")
         except ChatAdminRequired:
             raise Exception("Admin rights required to access this content.")
         except PeerIdInvalid:
+            self._forget_peer(chat_id)
             raise Exception("Cannot find this channel. Please make sure you're a member. Try opening the channel in your Telegram app first, then try again.")
         except Exception as e:
             raise Exception(f"Download failed: {str(e)}")
     
-    async def _download_with_progress(self, message, file_path, progress_callback=None):
-        """Download file with progress tracking"""
-        def progress(current, total):
-            if progress_callback and total > 0:
-                percentage = (current / total) * 100
-                progress_callback(percentage, current, total)
+    async def _record_download(self, file_name, file_size):
+        """Write download stats off the event loop"""
+        await asyncio.to_thread(self.db.record_download, self.user_id, file_name, file_size)
+    
+    async def _download_with_progress(self, message, file_path, progress_callback=None, media=None):
+        """Download file with progress tracking; disk writes run in a thread, overlapping the next chunk fetch"""
+        last_pct = -1
+        last_time = 0.0
         
-        download_path = await message.download(file_name=file_path, progress=progress)
-        return download_path
+        async def progress(current, total):
+            nonlocal last_pct, last_time
+            if total <= 0:
+                return
+            # Chunks arrive every 1MB; pass on only whole-percent changes or a periodic heartbeat
+            pct = current * 100 // total
+            now = time.monotonic()
+            if pct == last_pct and now - last_time < PROGRESS_MIN_INTERVAL:
+                return
+            last_pct, last_time = pct, now
+            
+            result = progress_callback((current / total) * 100, current, total)
+            if asyncio.iscoroutine(result):
+                await result
+        
+        total = getattr(media, 'file_size', 0) or 0
+        current = 0
+        write = None
+        completed = False
+        
+        os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+        f = open(file_path, "wb")
+        try:
+            async for chunk in self.client.stream_media(message):
+                # At most one write in flight, so chunks land in order
+                if write:
+                    await write
+                write = asyncio.ensure_future(asyncio.to_thread(f.write, chunk))
+                current += len(chunk)
+                if progress_callback:
+                    await progress(current, total)
+            if write:
+                await write
+            completed = True
+        finally:
+            if write and not write.done():
+                await asyncio.wait([write])
+            f.close()
+            if not completed:
+                await FileManager.cleanup_file_async(file_path)
+        
+        return file_path
     
     # REMOVED upload_file method - files will be uploaded through the bot instead
     
@@ -159,26 +262,77 @@ class UserSession:
         if not self.is_connected:
             raise Exception("User session not connected")
         
-        downloaded_files = []
+        total = len(message_ids)
+        stats = []
         
-        for i, message_id in enumerate(message_ids):
-            try:
+        async def download_one(i, message_id):
+            async with self._download_sem:
                 if progress_callback:
-                    progress_callback(f"Downloading {i+1}/{len(message_ids)}...", i+1, len(message_ids))
-                
-                file_path = await self.download_file(chat_id, message_id)
-                downloaded_files.append(file_path)
-                
-                # Add cooldown between downloads
-                await asyncio.sleep(1)  # Reduced from 2 to 1 second
-                
-            except Exception as e:
-                print(f"❌ Failed to download message {message_id}: {e}")
-                continue
+                    progress_callback(f"Downloading {i+1}/{total}...", i+1, total)
+                return await self.download_file(chat_id, message_id, stats=stats)
+        
+        # Downloads overlap up to the semaphore limit; results keep message order
+        results = await asyncio.gather(
+            *(download_one(i, message_id) for i, message_id in enumerate(message_ids)),
+            return_exceptions=True
+        )
+        
+        downloaded_files = []
+        for message_id, result in zip(message_ids, results):
+            if isinstance(result, Exception):
+                print(f"❌ Failed to download message {message_id}: {result}")
+            else:
+                downloaded_files.append(result)
+        
+        if stats:
+            await asyncio.to_thread(self.db.record_downloads, self.user_id, len(stats), stats)
         
         return downloaded_files
 
     async def resolve_peer(self, chat_id: str):
+        """Resolve peer, remembering recent hits and misses per user"""
+        key = self._peer_key(chat_id)
+        now = time.monotonic()
+        
+        for cache, result in ((UserSession._peer_ok, True), (UserSession._peer_miss, False)):
+            expires = cache.get(key)
+            if expires is not None:
+                if expires > now:
+                    cache.move_to_end(key)
+                    return result
+                del cache[key]
+        
+        resolved = await self._resolve_peer_uncached(chat_id)
+        self._cache_peer(key, resolved)
+        return resolved
+    
+    def _peer_key(self, chat_id):
+        """Cache key for a chat as this user refers to it"""
+        return (self.user_id, int(chat_id) if str(chat_id).lstrip('-').isdigit() else str(chat_id).lower())
+    
+    def _forget_peer(self, chat_id):
+        """Stop trusting a cached hit once Telegram rejects the chat"""
+        UserSession._peer_ok.pop(self._peer_key(chat_id), None)
+    
+    @staticmethod
+    def forget_user_peers(user_id):
+        """Drop a user's cached results, e.g. when a new login replaces the session's access hashes"""
+        for cache in (UserSession._peer_ok, UserSession._peer_miss):
+            for key in [key for key in cache if key[0] == user_id]:
+                del cache[key]
+    
+    @staticmethod
+    def _cache_peer(key, resolved: bool):
+        """Record a resolve_peer result until its TTL runs out"""
+        if resolved:
+            UserSession._peer_miss.pop(key, None)
+        cache = UserSession._peer_ok if resolved else UserSession._peer_miss
+        cache[key] = time.monotonic() + (PEER_OK_TTL if resolved else PEER_MISS_TTL)
+        cache.move_to_end(key)
+        while len(cache) > PEER_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    async def _resolve_peer_uncached(self, chat_id: str):
         """Resolve peer to ensure it's in the session cache - IMPROVED FOR PRIVATE CHANNELS"""
         try:
             chat_id_int = int(chat_id) if isinstance(chat_id, str) and chat_id.lstrip('-').isdigit() else None
@@ -210,7 +364,8 @@ class UserSession:
                         if dialog.chat.id == chat_id_int:
                             print(f"✅ Found channel in dialogs: {dialog.chat.title}")
                             found_chat = dialog.chat
-                            # Continue loading to fully populate cache
+                            # The peer (with access_hash) is stored as the dialog page arrives
+                            break
                 except Exception as e:
                     print(f"⚠️ Error loading dialogs: {e}")
                 
@@ -265,10 +420,12 @@ class UserSession:
             return message
             
         except ChannelPrivate:
+            self._forget_peer(chat_id)
             raise Exception("❌ This channel is private. Please make sure you're a member and have joined the channel to access its content.")
         except UserNotParticipant:
             raise Exception("❌ You're not a member of this channel. Please join the channel first to download content from it.")
         except PeerIdInvalid:
+            self._forget_peer(chat_id)
             raise Exception("❌ Channel not found in your Telegram account. Make sure:\n1. You are a member of this channel\n2. Open the channel in your Telegram app\n3. Send any message in the channel (if allowed)\n4. Then try downloading again")
         except Exception as e:
             raise Exception(f"❌ Cannot access message: {str(e)}")
@@ -285,8 +442,15 @@ class UserSession:
             
             if joined_chat:
                 print(f"✅ Successfully joined: {joined_chat.title}")
-                # Reload channels after joining
-                await self.load_joined_channels()
+                # Add the new chat instead of reloading every dialog
+                self.joined_channels[joined_chat.id] = {
+                    'id': joined_chat.id,
+                    'title': joined_chat.title,
+                    'username': getattr(joined_chat, 'username', None),
+                    'type': joined_chat.type,
+                    'is_restricted': getattr(joined_chat, 'is_restricted', False)
+                }
+                self._cache_peer((self.user_id, joined_chat.id), True)
                 return True
             else:
                 print("❌ Failed to join channel")
@@ -303,6 +467,7 @@ class UserSession:
     
     async def cleanup_invalid_session(self):
         """Clean up invalid session"""
+        await self.auth_manager.forget_user_session(self.user_id)
         session_file = self.auth_manager.get_user_session_file(self.user_id)
         if os.path.exists(session_file):
             try:
@@ -329,17 +494,18 @@ class UserSession:
             
             if copied:
                 # Update download stats
-                self.db.increment_download_count(self.user_id)
-                self.db.add_download_stat(self.user_id, f"forward_{message_id}", 0)
+                await self._record_download(f"forward_{message_id}", 0)
                 print(f"✅ Forwarded message {message_id} to user {to_user_id}")
                 return True
             return False
             
         except ChannelPrivate:
+            self._forget_peer(from_chat_id)
             raise Exception("This channel is private and you cannot access it. Please make sure you're a member.")
         except UserNotParticipant:
             raise Exception("You are not a member of this channel. Please join first.")
         except PeerIdInvalid:
+            self._forget_peer(from_chat_id)
             raise Exception("Cannot find this channel. Please make sure you're a member.")
         except Exception as e:
             raise Exception(f"Forward failed: {str(e)}")
@@ -355,31 +521,65 @@ class UserSession:
             # Resolve peer first
             await self.resolve_peer(from_chat_id)
             
-            # Get messages in range
-            message_ids = list(range(start_message_id, start_message_id + count))
-            
-            for i, msg_id in enumerate(message_ids):
-                try:
+            async def with_flood_retry(call, msg_id):
+                # Back off only when Telegram asks, instead of sleeping after every message
+                for attempt in range(FLOOD_WAIT_RETRIES + 1):
+                    try:
+                        return await call()
+                    except FloodWait as e:
+                        if attempt == FLOOD_WAIT_RETRIES:
+                            raise
+                        print(f"⏳ FloodWait: sleeping {e.value}s before retrying message {msg_id}")
+                        await asyncio.sleep(e.value)
+            
+            # A fixed set of workers fetches messages ahead from one shared iterator, while the
+            # copies are sent one at a time in id order so they reach the user in order.
+            # A slot is held from fetch until send, so at most BATCH_COPY_CONCURRENCY wait at once
+            message_ids = range(start_message_id, start_message_id + count)
+            pending_ids = iter(message_ids)
+            fetched = {}  # {msg_id: Message or the exception fetching it raised}
+            arrived = asyncio.Event()
+            slots = asyncio.Semaphore(BATCH_COPY_CONCURRENCY)
+            
+            async def worker():
+                while True:
+                    await slots.acquire()
+                    msg_id = next(pending_ids, None)
+                    if msg_id is None:
+                        slots.release()
+                        return
+                    try:
+                        fetched[msg_id] = await with_flood_retry(
+                            lambda: self.client.get_messages(from_chat_id, msg_id), msg_id
+                        )
+                    except Exception as e:
+                        fetched[msg_id] = e
+                    arrived.set()
+            
+            workers = [asyncio.create_task(worker()) for _ in range(min(BATCH_COPY_CONCURRENCY, count))]
+            try:
+                for done, msg_id in enumerate(message_ids, 1):
+                    while msg_id not in fetched:
+                        arrived.clear()
+                        await arrived.wait()
+                    message = fetched.pop(msg_id)
+                    slots.release()
+                    try:
+                        if isinstance(message, Exception):
+                            raise message
+                        if await with_flood_retry(lambda: message.copy(to_user_id), msg_id):
+                            success_count += 1
+                    except Exception as e:
+                        print(f"⚠️ Could not forward message {msg_id}: {e}")
                     if progress_callback:
-                        progress_callback(f"Forwarding {i+1}/{count}...", i+1, count)
-                    
-                    # Try to copy this message
-                    copied = await self.client.copy_message(
-                        chat_id=to_user_id,
-                        from_chat_id=from_chat_id,
-                        message_id=msg_id
-                    )
-                    
-                    if copied:
-                        success_count += 1
-                        self.db.increment_download_count(self.user_id)
-                    
-                    # Small delay to avoid flood
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"⚠️ Could not forward message {msg_id}: {e}")
-                    continue
+                        progress_callback(f"Forwarding {done}/{count}...", done, count)
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            
+            if success_count:
+                await asyncio.to_thread(self.db.record_downloads, self.user_id, success_count)
             
             return success_count
             
@@ -387,16 +587,13 @@ class UserSession:
             raise Exception(f"Batch forward failed: {str(e)}")
 
     async def disconnect(self):
-        """Disconnect user session"""
+        """Release user session; the auth manager keeps the client connected for reuse"""
         if self.client and self.is_connected:
-            try:
-                await self.client.disconnect()  # Faster than stop()
-                self.is_connected = False
-                print(f"✅ User session disconnected: {self.user_id}")
-            except Exception as e:
-                print(f"⚠️ Error disconnecting user session {self.user_id}: {e}")
+            self.auth_manager.release_user_session(self.user_id)
+            self.is_connected = False
+            print(f"✅ User session released: {self.user_id}")
     
-    async def _generate_filename(self, message: Message) -> str:
+    def _generate_filename(self, message: Message) -> str:
         """Generate proper filename with correct extension - FIXED"""
         if message.video:
             media = message.video
@@ -408,15 +605,7 @@ class UserSession:
             # Get extension from mime_type for documents
             if media.mime_type:
                 mime_ext = media.mime_type.split('/')[-1]
-                # Map common mime types to proper extensions
-                mime_to_ext = {
-                    'mp4': 'mp4', 'mpeg': 'mp3', 'x-m4a': 'm4a', 'ogg': 'ogg',
-                    'webm': 'webm', 'x-matroska': 'mkv', 'quicktime': 'mov',
-                    'x-msvideo': 'avi', 'x-flv': 'flv', '3gpp': '3gp',
-                    'jpeg': 'jpg', 'png': 'png', 'gif': 'gif', 'webp': 'webp',
-                    'pdf': 'pdf', 'zip': 'zip', 'x-rar': 'rar', 'x-7z-compressed': '7z'
-                }
-                default_ext = mime_to_ext.get(mime_ext, mime_ext)
+                default_ext = _MIME_EXT_MAP.get(mime_ext, mime_ext)
             else:
                 default_ext = "bin"
         elif message.audio:
@@ -472,29 +661,7 @@ class UserSession:
             if len(mime_parts) == 2:
                 ext = mime_parts[1]
                 # Clean up common mime type to extension mappings
-                ext_mapping = {
-                    'vnd.android.package-archive': 'apk',
-                    'octet-stream': 'bin',
-                    'zip': 'zip',
-                    'pdf': 'pdf',
-                    'msword': 'doc',
-                    'vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
-                    'vnd.ms-excel': 'xls',
-                    'vnd.openxmlformats-officedocument.spreadsheetml.sheet': 'xlsx',
-                    'vnd.ms-powerpoint': 'ppt',
-                    'vnd.openxmlformats-officedocument.presentationml.presentation': 'pptx'
-                }
-                return ext_mapping.get(ext, ext)
+                return _MIME_EXT_MAP.get(ext, ext)
         
         # Fallback to type-based extensions
-        extensions = {
-            'video': 'mp4',
-            'audio': 'mp3',
-            'photo': 'jpg',
-            'sticker': 'webp',
-            'animation': 'mp4',
-            'voice': 'ogg',
-            'video_note': 'mp4'
-        }
-        
-        return extensions.get(media_type, 'bin')
\ No newline at end of file
+        return _TYPE_EXT_MAP.get(media_type, 'bin')
\ No newline at end of file
@@ -1,5 +1,22 @@
 import re
 import os
+import time
+import asyncio
+
+# Telegram message link formats in one pass; alternatives are tried in order and,
+# like re.match, only the start of the link has to match
+_RE_LINK = re.compile(
+    r'(?:https?://)?t\.me/c/(?P<priv_id>\d+)/(?P<priv_msg>\d+)'
+    r'|(?:https?://)?(?:t\.me|telegram\.me)/(?P<pub_user>[a-zA-Z0-9_]+)/(?P<pub_msg>\d+)'
+    r'|@(?P<short_user>[a-zA-Z0-9_]+)/(?P<short_msg>\d+)'
+)
+
+# Seconds before an untouched login flow or a stuck processing flag is dropped
+AUTH_STATE_TTL = 10 * 60
+PROCESSING_TTL = 30 * 60
+
+# Characters not allowed in filenames, each mapped to an underscore
+_BAD_CHAR_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
 
 class LinkParser:
     @staticmethod
@@ -14,36 +31,27 @@ class LinkParser:
         if not link:
             return None
             
+        match = _RE_LINK.match(link.strip())
+        if not match:
+            return None
+        
         # Private chat links: t.me/c/123456789/2
-        private_match = re.match(r'(?:https?://)?t\.me/c/(\d+)/(\d+)', link.strip())
-        if private_match:
-            channel_id = int(private_match.group(1))
-            message_id = int(private_match.group(2))
-            proper_chat_id = f"-100{channel_id}"
-            return proper_chat_id, message_id, "private"
+        if match['priv_id'] is not None:
+            proper_chat_id = f"-100{int(match['priv_id'])}"
+            return proper_chat_id, int(match['priv_msg']), "private"
         
         # Public channel links: t.me/username/123
-        public_match = re.match(r'(?:https?://)?(?:t\.me|telegram\.me)/([a-zA-Z0-9_]+)/(\d+)', link.strip())
-        if public_match:
-            username = public_match.group(1)
-            message_id = int(public_match.group(2))
-            return username, message_id, "public"
+        if match['pub_user'] is not None:
+            return match['pub_user'], int(match['pub_msg']), "public"
         
         # Short format: @username/123
-        short_match = re.match(r'@([a-zA-Z0-9_]+)/(\d+)', link.strip())
-        if short_match:
-            username = short_match.group(1)
-            message_id = int(short_match.group(2))
-            return username, message_id, "public"
-        
-        return None
+        return match['short_user'], int(match['short_msg']), "public"
 
 class FileManager:
     @staticmethod
     def clean_filename(filename: str) -> str:
         """Clean filename to remove invalid characters"""
-        cleaned = re.sub(r'[<>:"/\\|?*]', '_', filename)
-        return cleaned.strip()
+        return filename.translate(_BAD_CHAR_TABLE).strip()
     
     @staticmethod
     def cleanup_file(path: str):
@@ -52,39 +60,76 @@ class FileManager:
             if os.path.exists(path):
                 os.remove(path)
                 print(f"🧹 Cleaned up file: {path}")
+            # Drop the per-download directory once its file is gone
+            parent = os.path.dirname(path)
+            if os.path.basename(os.path.dirname(parent)) == "downloads" and os.path.isdir(parent) and not os.listdir(parent):
+                os.rmdir(parent)
         except Exception as e:
             print(f"⚠️ Failed to cleanup file {path}: {e}")
+    
+    @staticmethod
+    async def cleanup_file_async(path: str):
+        """Remove temporary file without blocking the event loop"""
+        await asyncio.to_thread(FileManager.cleanup_file, path)
 
 class UserManager:
     """Manage user states for authentication"""
     
     def __init__(self):
         self.auth_states = {}  # {user_id: {'state': 'awaiting_phone', 'data': {}}}
-        self.processing_users = set()
+        self.processing_users = {}  # {user_id: expiry}
+        # Abandoned login flows and crashed handlers expire instead of piling up
+        self._auth_expiry = {}  # {user_id: expiry}
+        self._next_sweep = 0.0
+    
+    def _sweep(self, now):
+        """Drop expired auth states and processing flags, at most once per TTL"""
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + AUTH_STATE_TTL
+        for user_id in [uid for uid, expiry in self._auth_expiry.items() if expiry <= now]:
+            self.clear_auth_state(user_id)
+        for user_id in [uid for uid, expiry in self.processing_users.items() if expiry <= now]:
+            del self.processing_users[user_id]
     
     def set_auth_state(self, user_id, state, data=None):
         """Set user authentication state"""
         if data is None:
             data = {}
+        now = time.monotonic()
+        self._sweep(now)
         self.auth_states[user_id] = {'state': state, 'data': data}
+        self._auth_expiry[user_id] = now + AUTH_STATE_TTL
     
     def get_auth_state(self, user_id):
         """Get user authentication state"""
+        expiry = self._auth_expiry.get(user_id)
+        if expiry is not None and expiry <= time.monotonic():
+            self.clear_auth_state(user_id)
+            return None
         return self.auth_states.get(user_id)
     
     def clear_auth_state(self, user_id):
         """Clear user authentication state"""
-        if user_id in self.auth_states:
-            del self.auth_states[user_id]
+        self.auth_states.pop(user_id, None)
+        self._auth_expiry.pop(user_id, None)
     
     def add_processing_user(self, user_id):
         """Add user to processing set"""
-        self.processing_users.add(user_id)
+        now = time.monotonic()
+        self._sweep(now)
+        self.processing_users[user_id] = now + PROCESSING_TTL
     
     def remove_processing_user(self, user_id):
         """Remove user from processing set"""
-        self.processing_users.discard(user_id)
+        self.processing_users.pop(user_id, None)
     
     def is_user_processing(self, user_id):
         """Check if user is processing"""
-        return user_id in self.processing_users
\ No newline at end of file
+        expiry = self.processing_users.get(user_id)
+        if expiry is None:
+            return False
+        if expiry <= time.monotonic():
+            del self.processing_users[user_id]
+            return False
+        return True